@@ -31,6 +31,7 @@ By default, the KBUS kernel module sources are copied from the directory
 containing this script. Use the -from switch to change this.
 """
 
+import mmap
 import os
 import shutil
 import sys
@@ -46,6 +47,58 @@ def expand_path(path):
     path = os.path.normpath(path)       # remove //, etc.
     return path
 
+def find_line_containing(path, text):
+    """Return the first line in the file 'path' that contains 'text'.
+
+    Returns None if there is no such line.
+    """
+    with open(path) as fd:
+        for line in fd:
+            if text in line:
+                return line
+    return None
+
+def append_lines(path, lines):
+    """Append an empty line, and then 'lines', to the end of the file 'path'.
+    """
+    with open(path, 'a') as fd:
+        fd.write('\n')
+        fd.writelines(lines)
+
+def find_kbus_default(path):
+    """Find the 'default' line for KBUS in the Kconfig file 'path'.
+
+    That is, the line after the 'tristate' line after the 'config KBUS' line.
+
+    Returns (offset, line), where 'offset' is the position of the start of
+    that line within the file, or None if there is no such line.
+    """
+    with open(path, 'rb') as fd:
+        if os.fstat(fd.fileno()).st_size == 0:
+            return None
+        mm = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            def line_at(start):
+                end = mm.find(b'\n', start)
+                if end == -1:
+                    end = len(mm)
+                return mm[start:end+1], end+1
+
+            pos = mm.find(b'config KBUS')
+            while pos != -1:
+                start = mm.rfind(b'\n', 0, pos) + 1
+                if not mm[start:pos].strip():
+                    config_line, next_start = line_at(start)
+                    tristate_line, default_start = line_at(next_start)
+                    default_line, _ = line_at(default_start)
+                    if tristate_line.strip().startswith(b'tristate') and \
+                       default_line.strip().startswith(b'default'):
+                        return default_start, default_line
+                pos = mm.find(b'config KBUS', pos+1)
+            return None
+        finally:
+            mm.close()
+
 def main(args):
     if not args:
         raise GiveUp(__doc__)
@@ -111,25 +164,15 @@ def main(args):
     # if they're not already there
     ipc_makefile = os.path.join(ipc_dir, 'Makefile')
     print 'Looking at', ipc_makefile
-    with open(ipc_makefile) as fd:
-        lines = fd.readlines()
-    found_kbus = False
-    for line in lines:
-        if 'CONFIG_KBUS' in line:
-            found_kbus = True
-            break
-    if found_kbus:
+    line = find_line_containing(ipc_makefile, 'CONFIG_KBUS')
+    if line is not None:
         print '  KBUS appears to be there already'
         print '    "%s"'%line.strip()
     else:
         print '  Adding KBUS lines to the end'
         with open(os.path.join(kbus_dir, 'other', 'ipc', 'Makefile_kbus_lines')) as fd:
             extra_lines = fd.readlines()
-        lines.append('\n')
-        for line in extra_lines:
-            lines.append(line)
-        with open(ipc_makefile, 'w') as fd:
-            fd.writelines(lines)
+        append_lines(ipc_makefile, extra_lines)
 
     # Kconfig is a bit more complicated
     ipc_kconfig = os.path.join(ipc_dir, 'Kconfig')
@@ -137,43 +180,24 @@ def main(args):
     print 'Looking at', ipc_kconfig
     if os.path.exists(ipc_kconfig):
         print '  The IPC Kconfig file already exists'
-        with open(ipc_makefile) as fd:
-            lines = fd.readlines()
-        found_kbus = False
-        for line in lines:
-            if 'KBUS' in line:
-                found_kbus = True
-                break
-        if found_kbus:
+        if find_line_containing(ipc_kconfig, 'KBUS') is not None:
             print '  KBUS appears to be there already'
         else:
             print '  KBUS does not appear to be there yet - adding KBUS lines to the end'
             with open(kbus_kconfig) as fd:
                 extra_lines = fd.readlines()
-            lines.append('\n')
-            for line in extra_lines:
-                lines.append(line)
-            with open(ipc_makefile, 'w') as fd:
-                fd.writelines(lines)
+            append_lines(ipc_kconfig, extra_lines)
     else:
         print '  The IPC Kconfig file does not exist yet'
         print '  Copying the KBUS IPC Kconfig file'
         shutil.copy2(kbus_kconfig, ipc_kconfig)
 
     print 'Checking the KBUS default in', ipc_kconfig
-    with open(ipc_kconfig) as fd:
-        lines = fd.readlines()
-    found_line = None
-    for count, line in enumerate(lines):
-        if line.strip().startswith('config KBUS'):
-            if lines[count+1].strip().startswith('tristate') and \
-               lines[count+2].strip().startswith('default'):
-                   found_line = count+2
-                   break
-    if found_line is None:
+    found = find_kbus_default(ipc_kconfig)
+    if found is None:
         raise GiveUp("Cannot find KBUS configuration in %s"%ipc_kconfig)
 
-    default_line = lines[found_line]
+    default_offset, default_line = found
     words = default_line.split()
     state = words[1].lower()
 
@@ -182,31 +206,42 @@ def main(args):
             print "  KBUS defaults to '%s', which matches the requested state"%state
         else:
             print "  KBUS was defaulting to '%s', changing it to '%s'"%(state, default_action)
-            leader = ''
-            for ch in default_line:
-                if ch in (' ', '\t'):
-                    leader += ch
-                else:
-                    break
-            lines[found_line] = '%sdefault %s\n'%(leader, default_action)
-            with open(ipc_kconfig, 'w') as fd:
-                fd.writelines(lines)
+            if len(words[1]) == len(default_action):
+                # We can just overwrite the value where it is
+                value_offset = default_line.index(words[1],
+                                default_line.index('default') + len('default'))
+                with open(ipc_kconfig, 'r+b') as fd:
+                    fd.seek(default_offset + value_offset)
+                    fd.write(default_action)
+            else:
+                leader = ''
+                for ch in default_line:
+                    if ch in (' ', '\t'):
+                        leader += ch
+                    else:
+                        break
+                with open(ipc_kconfig, 'rb') as fd:
+                    data = fd.read()
+                with open(ipc_kconfig, 'wb') as fd:
+                    fd.write(data[:default_offset])
+                    fd.write('%sdefault %s\n'%(leader, default_action))
+                    fd.write(data[default_offset+len(default_line):])
     else:
         print "  KBUS defaults to '%s'"%state
 
     # We probably need to edit the 'init' Kconfig file
     init_kconfig = os.path.join(linux_dir, 'init', 'Kconfig')
     print 'Looking at', init_kconfig
-    with open(init_kconfig) as fd:
-        lines = fd.readlines()
     found_ipc_kconfig = False
-    for line in lines:
-        if 'ipc/Kconfig' in line:
-            # That's probably the right line, but let's be more specific
-            words = line.split(line)
-            if words[0] == 'source' and words[1] == 'ipc/Kconfig':
-                found_ipc_kconfig = True
-                break
+    with open(init_kconfig) as fd:
+        for line in fd:
+            if 'ipc/Kconfig' in line:
+                # That's probably the right line, but let's be more specific
+                words = line.split()
+                if len(words) == 2 and words[0] == 'source' and \
+                   words[1].strip('"') == 'ipc/Kconfig':
+                    found_ipc_kconfig = True
+                    break
 
     if found_ipc_kconfig:
         print '  It already sources the IPC Kconfig'
@@ -214,10 +249,7 @@ def main(args):
         print '  Adding \'source "ipc/Kconfig"\' to the end'
         # Given it's just for KBUS, we'll add it to the end, since that
         # is simplest to do and simplest to find when configuring
-        lines.append('\n')
-        lines.append('source "ipc/Kconfig"\n')
-        with open(init_kconfig, 'w') as fd:
-            fd.writelines(lines)
+        append_lines(init_kconfig, ['source "ipc/Kconfig"\n'])
 
     # And that's all...
     print 'Done'
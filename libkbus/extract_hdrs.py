@@ -80,23 +80,26 @@ from difflib import ndiff
 pattern = r"""\
 (?P<header>                     # start of header group
      \s* / \* .* \n             # start of header comment
-    (\s*   \* .* \n)*           # 0 or more comment lines
+    (?:\s*  \* .* \n)*          # 0 or more comment lines
      \s*   \* /  \n             # end of header comment
      \s* extern \s+
         (?P<type>               # crudely allow for type info
-          #(\w+ \s+) |                  # e.g., "fred "
-          (\w+ \s+ \** \s*) |           # e.g., "fred *"
-          (\w+ \s+ \w+ \s+ \** \s*)     # e.g., "struct fred " or "struct fred *"
+          #(?:\w+ \s+) |                # e.g., "fred "
+          (?:\w+ \s+ \** \s*) |         # e.g., "fred *"
+          (?:\w+ \s+ \w+ \s+ \** \s*)   # e.g., "struct fred " or "struct fred *"
         )
         (?P<name>
             \w+                 # name of function
         )
-     \(  ([^)]|\n)* \)          # crudely match arguments
+     \(  [^)]* \)               # crudely match arguments ([^)] includes newlines)
 )                               # end of header group
 \s* \n
 \s* {
 """
 
+# We only ever need the one compiled form of the pattern
+header_re = re.compile(pattern, re.VERBOSE)
+
 start_delimiter = "// -------- TEXT AFTER THIS AUTOGENERATED - DO NOT EDIT --------\n"
 start_timestamp = "// Autogenerated by extract_hdrs.py on %s\n"
 end_delimiter = "// -------- TEXT BEFORE THIS AUTOGENERATED - DO NOT EDIT --------\n"
@@ -113,12 +116,13 @@ def extract_headers(c_file):
     """
     with open(c_file,'r') as file:
         data = file.read()
-    headers = re.finditer(pattern, data, re.VERBOSE)
     new = []
+    append = new.append
     # Turn our function header into prototypes
-    for hdr in headers:
+    for hdr in header_re.finditer(data):
         print '  Found ',hdr.group('name')
-        new.append(hdr.group('header')+';\n')
+        append(hdr.group('header'))
+        append(';\n')
     return ''.join(new)
 
 def split_header_file(h_file):
@@ -190,10 +194,7 @@ def process_file(c_file, h_file):
         timestamp_line = start_timestamp%timestamp_str
 
         with open(temp_file, 'w') as output:
-            output.write(start)
-            output.write(timestamp_line)
-            output.write(new_middle)
-            output.write(end)
+            output.writelines((start, timestamp_line, new_middle, end))
 
         os.rename(h_file, save_file)
         os.rename(temp_file, h_file)
@@ -30,6 +30,8 @@ either on the same machine or over a network.
 #
 # ***** END LICENSE BLOCK *****
 
+from __future__ import print_function
+
 import ctypes
 import errno
 import os
@@ -40,7 +42,7 @@ import sys
 
 from socket import ntohl, htonl
 
-from kbus import Ksock, Message, Reply, MessageId, OrigFrom
+from kbus import Ksock, Message, MessageId, OrigFrom
 from kbus.messages import _MessageHeaderStruct, _ReplierBindEventHeader, \
         message_from_parts, _struct_from_bytes, _struct_to_bytes, \
         split_replier_bind_event_data, \
@@ -78,7 +80,46 @@ class BadMessage(Exception):
     pass
 
 _SERIALISED_MESSAGE_HEADER_LEN = 16
-_SerialisedMessageHeaderType = ctypes.c_uint32 * _SERIALISED_MESSAGE_HEADER_LEN
+
+# We check every message to see if it is a Replier Bind Event. Looking at the
+# length of its name first is cheap, and means we don't need to make a string
+# of the name for most messages.
+_REPLIER_BIND_EVENT = '$.KBUS.ReplierBindEvent'
+_REPLIER_BIND_EVENT_LEN = len(_REPLIER_BIND_EVENT)
+
+# How many message names we will remember the Replier for, before we start
+# again from scratch
+_MAX_REPLIER_CACHE_LEN = 1024
+
+# The flags on a Request that wants *us* to reply to it. We test message
+# flags directly, rather than via the Message methods, as this is done for
+# every message we proxy
+_REQUEST_FOR_US = Message.WANT_A_REPLY | Message.WANT_YOU_TO_REPLY
+
+# When coalescing messages from KBUS to send to the other Limpet, we send
+# as soon as we have this many bytes, and adjust how long we wait for more
+# messages in steps of this many microseconds
+_COALESCE_BYTES = 16384
+_COALESCE_STEP_US = 10
+
+# The names of the messages we send back to the other Limpet when sending a
+# Request to our KBUS fails, by errno
+_REMOTE_ERROR_NAMES = dict((num, '$.KBUS.RemoteError.%s'%name)
+                           for num, name in errno.errorcode.items())
+
+# Packs/unpacks a serialised message header, in network order
+_SerialisedMessageHeaderStruct = struct.Struct('!%dL'%_SERIALISED_MESSAGE_HEADER_LEN)
+
+# Packs/unpacks the final end guard of a serialised message
+_EndGuardStruct = struct.Struct('!L')
+_END_GUARD = _EndGuardStruct.pack(Message.END_GUARD)
+
+# Enough zero bytes for any padding we need to add
+_ZEROS = '\0'*4
+
+# Packs/unpacks the greeting a Limpet sends its pair: 'HELO' and then its
+# network id
+_HelloStruct = struct.Struct('!4sL')
 
 class LimpetKsock(Ksock):
     """A Limpet proxies KBUS messages to/from another Limpet.
@@ -139,6 +180,13 @@ class LimpetKsock(Ksock):
         self.verbosity = verbosity
         self.termination_message = termination_message
 
+        # We check the name of every message we read against the termination
+        # message, so compare lengths first - no name has length -1
+        if termination_message is None:
+            self._termination_name_len = -1
+        else:
+            self._termination_name_len = len(termination_message)
+
         self._ksock_id = self.ksock_id()
 
         # A dictionary of { <message_name> : <binder_id> } of the messages
@@ -150,6 +198,17 @@ class LimpetKsock(Ksock):
         # the key, and the from/to information as the data
         self.our_requests = {}
 
+        # A cache of { <message_name> : <replier_id> }, as found by
+        # find_replier(). Any Replier binding or unbinding may change the
+        # answers (not least because of wildcards), so we empty it whenever
+        # we hear of one.
+        self._replier_cache = {}
+
+        # If the Stateful Request we are sending was addressed using a
+        # cached Replier id, then (<report header>, <is_local>, <name>) for
+        # it, so that we can check with KBUS if sending it fails
+        self._request_to_recheck = None
+
         # So we're set up to talk at both ends - now sort out what we're
         # talking about
 
@@ -168,7 +227,7 @@ class LimpetKsock(Ksock):
             # - since we're only going to get one copy of each message, it is
             # safe to bind to this again, even if the ``message_name`` has
             # implicitly already done that
-            super(LimpetKsock, self).bind('$.KBUS.ReplierBindEvent')
+            super(LimpetKsock, self).bind(_REPLIER_BIND_EVENT)
 
             # And ask KBUS to *send* such messages
             super(LimpetKsock, self).report_replier_binds(True)
@@ -198,6 +257,14 @@ class LimpetKsock(Ksock):
         """Not meaningful for this class."""
         raise NotImplemented('unbind method is not relevant to LimpetKsock')
 
+    def bind_many(self, *args):
+        """Not meaningful for this class."""
+        raise NotImplemented('bind_many method is not relevant to LimpetKsock')
+
+    def unbind_many(self, *args):
+        """Not meaningful for this class."""
+        raise NotImplemented('unbind_many method is not relevant to LimpetKsock')
+
     def len_left(self):
         """Not meaningful for this class.
 
@@ -253,12 +320,49 @@ class LimpetKsock(Ksock):
         If we need to send a message back to the other Limpet, then that
         exception will have the messsage as its argument.
         """
+        self._request_to_recheck = None
         message = self._handle_message_from_socket(message)
         if message is None:
             raise NoMessage()
 
         super(LimpetKsock, self).write_msg(message)
-        return super(LimpetKsock, self).send()
+        try:
+            return super(LimpetKsock, self).send()
+        except IOError as exc:
+            recheck = self._request_to_recheck
+            if recheck is None or \
+               exc.errno not in (errno.EPIPE, errno.EADDRNOTAVAIL):
+                # Only those errors mean our remembered Replier has gone -
+                # anything else (for instance, EAGAIN leaving the message
+                # still being sent) is not ours to retry
+                raise
+            # We addressed this Request using a Replier id we remembered,
+            # and KBUS has told us that Replier is no longer there.
+            # So forget it, ask KBUS who the Replier is now, and try again
+            # (which may instead raise ErrorMessage, just as if we had
+            # asked KBUS in the first place)
+            self._request_to_recheck = None
+            hdr, is_local, name = recheck
+            self._replier_cache.pop(name, None)
+            message = self._address_request(hdr, message, is_local,
+                                            self._find_replier_for(name))
+            super(LimpetKsock, self).write_msg(message)
+            return super(LimpetKsock, self).send()
+
+    def send_msgs(self, messages):
+        """Send each of a sequence of :class:`~kbus.Message` (from the other
+        Limpet) to our :class:`~kbus.Ksock`.
+
+        Each Message is sent with :meth:`send_msg`, so is amended just as if
+        it had been sent singly, and returns a list of the :class:`MessageId`
+        of each message sent.
+
+        As with :meth:`send_msg`, raises :class:`NoMessage` or
+        :class:`ErrorMessage` for a Message we do not send - any Messages
+        later in the sequence are not sent.
+        """
+        send_msg = self.send_msg
+        return [send_msg(message) for message in messages]
 
     def write_data(self, data):
         """Not meaningful for this class.
@@ -285,7 +389,8 @@ class LimpetKsock(Ksock):
         if message is None:
             return None
 
-        if message.name == self.termination_message:
+        if message.msg.name_len == self._termination_name_len and \
+           message.name == self.termination_message:
             raise GiveUp('Received termination message %s to %s'%(
                 self.termination_message,str(self)))
 
@@ -310,10 +415,12 @@ class LimpetKsock(Ksock):
         if message is None:
             return None
 
-        print '>>> message %s'%message
-        print '>>> termina %s'%self.termination_message
+        if self.verbosity > 1:
+            print('>>> message %s'%message)
+            print('>>> termina %s'%self.termination_message)
 
-        if message.name == self.termination_message:
+        if message.msg.name_len == self._termination_name_len and \
+           message.name == self.termination_message:
             raise GiveUp('Received termination message %s to %s'%(
                 self.termination_message,str(self)))
 
@@ -323,6 +430,30 @@ class LimpetKsock(Ksock):
 
         return message
 
+    def read_batch(self, max_n=64):
+        """Read up to `max_n` Messages, and return them as a list.
+
+        Each Message is read with :meth:`read_msg`, so is amended (or
+        ignored) just as if it had been read singly. Messages that this
+        Limpet ignores do not count towards `max_n`, so an empty list
+        still means there was nothing (more) to be read.
+
+        As with :meth:`read_msg`, reading the termination message raises
+        GiveUp - any Messages already read in this batch are lost.
+        """
+        next_msg = self.next_msg
+        read_msg = self.read_msg
+        messages = []
+        append = messages.append
+        while len(messages) < max_n:
+            length = next_msg()
+            if not length:
+                break
+            message = read_msg(length)
+            if message is not None:
+                append(message)
+        return messages
+
     def read_data(self, count):
         """Not meaningful for this class.
 
@@ -344,8 +475,14 @@ class LimpetKsock(Ksock):
         # also receive a remote message called [130:27] -- we need to retain
         # these as distinct, so we can change the first (to have our own
         # "local" network id), but may not change the second.
-        if msg._id.network_id == 0:
-            msg._id.network_id = self.network_id
+        #
+        # (We fetch each ctypes sub-structure just the once, as every access
+        # through the message builds a new wrapper object for it.)
+        hdr = msg.msg
+        network_id = self.network_id
+        msg_id = hdr.id
+        if msg_id.network_id == 0:
+            msg_id.network_id = network_id
 
         # Limpets are responsible for setting the 'orig_from' field,
         # which indicates:
@@ -366,9 +503,10 @@ class LimpetKsock(Ksock):
         #
         # So, if we are the first Limpet to handle this message from
         # KBUS, then we give it our network id.
-        if msg._orig_from.network_id == 0:
-            msg._orig_from.network_id = self.network_id
-            msg._orig_from.local_id = msg.from_
+        orig_from = hdr.orig_from
+        if orig_from.network_id == 0:
+            orig_from.network_id = network_id
+            orig_from.local_id = hdr.from_
 
 
     def _handle_message_from_kbus(self, msg):
@@ -401,40 +539,47 @@ class LimpetKsock(Ksock):
 
         Returns the amended message, or None if the message is to be ignored.
         """
-        kbus_name   = 'KBUS%u'%self._ksock_id
-        limpet_name = 'Limpet%d'%self.other_network_id
-        kbus_to_us_hdr  = '%u %s->Us%s'%(self.network_id, kbus_name, ' '*(len(limpet_name)-2))
-        nowt_to_limpet_hdr = '%u %s->%s'%(self.network_id, ' '*len(kbus_name), limpet_name)
-        spaces_hdr = ' '*len(kbus_to_us_hdr)
-
-        if self.verbosity > 1:
-            print '%s %s'%(kbus_to_us_hdr, str(msg))
-
-        if msg.name == '$.KBUS.ReplierBindEvent':
+        # Only build our report headers if we're going to report anything
+        verbose = self.verbosity > 1
+        if verbose:
+            kbus_name   = 'KBUS%u'%self._ksock_id
+            limpet_name = 'Limpet%d'%self.other_network_id
+            kbus_to_us_hdr  = '%u %s->Us%s'%(self.network_id, kbus_name, ' '*(len(limpet_name)-2))
+            spaces_hdr = ' '*len(kbus_to_us_hdr)
+            print('%s %s'%(kbus_to_us_hdr, str(msg)))
+
+        if msg.msg.name_len == _REPLIER_BIND_EVENT_LEN and \
+           msg.name == _REPLIER_BIND_EVENT:
+            self._replier_cache.clear()
             # If this is the result of *us* binding as a replier (by proxy),
             # then we do *not* want to send it to the other Limpet!
             is_bind, binder_id, name = split_replier_bind_event_data(msg.data)
             if binder_id == self._ksock_id:
-                if self.verbosity > 1:
-                    print '%s Which is us -- ignore'%(spaces_hdr)
+                if verbose:
+                    print('%s Which is us -- ignore'%(spaces_hdr))
                 return None
 
-        if msg.is_request() and msg.wants_us_to_reply():
+        hdr = msg.msg
+        msg_id = hdr.id
+        network_id = msg_id.network_id
+
+        if hdr.flags & _REQUEST_FOR_US == _REQUEST_FOR_US:
             # Remember the details of this Request for when we get a Reply
             # (Note that the message id itself is not suitable as a key,
-            # as it is not immutable, and does not have a __hash__ method)
-            key = (msg._id.network_id, msg._id.serial_num)
-            self.our_requests[key] = (msg.from_, msg.to)
+            # as it is not immutable, and does not have a __hash__ method,
+            # so we pack its two 32-bit parts into a single integer)
+            key = (network_id << 32) | msg_id.serial_num
+            self.our_requests[key] = (hdr.from_, hdr.to)
 
-        if msg._id.network_id == self.other_network_id:
+        if network_id == self.other_network_id:
             # This is a message that originated with our pair Limpet (so it's
             # been from the other Limpet, to us, to KBUS, and we're now getting
             # it back again). Therefore we want to ignore it. When the original
             # message was sent to the other KBUS (before any Limpet touched
             # it), any listeners on that side would have heard it from that
             # KBUS, so we don't want to send it back to them yet again...
-            if self.verbosity > 1:
-                print '%s From the other Limpet -- ignore'%(spaces_hdr)
+            if verbose:
+                print('%s From the other Limpet -- ignore'%(spaces_hdr))
             return None
 
         self._sort_out_network_ids(msg)
@@ -452,28 +597,36 @@ class LimpetKsock(Ksock):
             msg._in_reply_to.network_id = 0
 
         # Look up the original Request and amend appropriately
-        key = (msg._in_reply_to.network_id, msg._in_reply_to.serial_num)
+        in_reply_to = msg._in_reply_to
+        key = (in_reply_to.network_id << 32) | in_reply_to.serial_num
         try:
-            from_, to = self.our_requests[key]
-            del self.our_requests[key]          # we shouldn't see it again
+            # We shouldn't see it again, so we can forget it as we look it up
+            from_, to = self.our_requests.pop(key)
 
             # What if it's a Status message? Essentially, we don't care,
             # since we still need to send it on anyway.
 
-            # The simplest thing to do is just to create a new Reply
-            # with the correct details
-            msg = Reply(msg.name, data=msg.data,
-                        in_reply_to=MessageId(key[0],key[1]),
-                        to=from_, orig_from=msg.orig_from)
+            # Rather than create a new Reply with the correct details, we
+            # amend this one in place to look just like such a new Reply,
+            # keeping its name, data, in_reply_to and orig_from
+            hdr_fields = msg.msg
+            hdr_fields.id.network_id = 0
+            hdr_fields.id.serial_num = 0
+            hdr_fields.to = from_
+            hdr_fields.from_ = 0
+            hdr_fields.final_to.network_id = 0
+            hdr_fields.final_to.local_id = 0
+            hdr_fields.extra = 0
+            hdr_fields.flags = 0
         except KeyError:
             # We already dealt with this Reply once, so this should not
             # happen (remember, we asked for only one copy of each message)
             if self.verbosity > 1:
-                print '%s ignored as a "listen" copy'%(' '*len(hdr))
+                print('%s ignored as a "listen" copy'%(' '*len(hdr)))
             raise
 
         if self.verbosity > 1:
-            print '%s as %s'%(' '*(len(hdr)-3), str(msg))
+            print('%s as %s'%(' '*(len(hdr)-3), str(msg)))
 
         return msg
 
@@ -490,39 +643,68 @@ class LimpetKsock(Ksock):
         # If the 'final_to' has a network id that matches ours,
         # then we need to unset that, as it has clearly now come
         # into its "local" network.
+        final_to = msg.msg.final_to
         if self.verbosity > 1:
-            print '%s *** final_to.network_id %u, network_id %u'%(hdr,
-                          msg._final_to.network_id, self.network_id)
-        if msg._final_to.network_id == self.network_id:
-            msg._final_to.network_id = 0        # XXX Do we need to do this?
+            print('%s *** final_to.network_id %u, network_id %u'%(hdr,
+                          final_to.network_id, self.network_id))
+        if final_to.network_id == self.network_id:
+            final_to.network_id = 0             # XXX Do we need to do this?
             is_local = True
         else:
             is_local = False
 
         # Find out who KBUS thinks is replying to this message name
-        replier_id = self.find_replier(msg.name)
+        # (only asking KBUS if we've not already been told)
+        name = msg.name
+        replier_id = self._replier_cache.get(name)
+        if replier_id is None:
+            replier_id = self._find_replier_for(name)
+        else:
+            self._request_to_recheck = (hdr, is_local, name)
+
+        return self._address_request(hdr, msg, is_local, replier_id)
+
+    def _find_replier_for(self, name):
+        """Ask KBUS who is the Replier for 'name', and remember the answer.
+
+        Returns the Replier's Ksock id, or None if there is no Replier.
+        """
+        replier_id = self.find_replier(name)
+        if replier_id is not None:
+            if len(self._replier_cache) >= _MAX_REPLIER_CACHE_LEN:
+                self._replier_cache.clear()
+            self._replier_cache[name] = replier_id
+        return replier_id
+
+    def _address_request(self, hdr, msg, is_local, replier_id):
+        """Address a Stateful Request from the other Limpet to 'replier_id'.
+
+        Returns the amended message, or raises ErrorMessage(<error message>)
+        if 'replier_id' is not a suitable Replier.
+        """
+        final_to = msg.msg.final_to
         if replier_id is None:
             # Oh dear - there is no replier
             if self.verbosity > 1:
-                print '%s *** There is no Replier - Replier gone away'%hdr
+                print('%s *** There is no Replier - Replier gone away'%hdr)
             error = Message('$.KBUS.Replier.GoneAway',
                             to=msg.from_,
                             in_reply_to=msg.id)
             raise ErrorMessage(error)
 
         if self.verbosity > 1:
-            print '%s *** %s, kbus replier %u'%(hdr,
-                  'Local' if is_local else 'Nonlocal',replier_id)
+            print('%s *** %s, kbus replier %u'%(hdr,
+                  'Local' if is_local else 'Nonlocal',replier_id))
 
         if is_local:
             # The KBUS we're going to write the message to is
             # the final KBUS. Thus the replier id must match
             # that of the original Replier
-            if replier_id != msg._final_to.local_id:
+            if replier_id != final_to.local_id:
                 # Oops - wrong replier - someone rebound
                 if self.verbosity > 1:
-                    print '%s *** Replier is %u, wanted %u - ' \
-                          'Replier gone away'%(hdr,replier_id,msg._final_to.local_id)
+                    print('%s *** Replier is %u, wanted %u - '
+                          'Replier gone away'%(hdr,replier_id,final_to.local_id))
                 error = Message('$.KBUS.Replier.NotSameKsock', # XXX New message name
                                 to=msg.from_,
                                 in_reply_to=msg.id)
@@ -533,7 +715,7 @@ class LimpetKsock(Ksock):
         if is_local:
             # If we're in our final stage, then we insist that the
             # Replier we deliver to be the Replier we expected
-            msg.msg.to = msg._final_to.local_id
+            msg.msg.to = final_to.local_id
         else:
             # If we're just passing through, then just deliver it to
             # whoever is listening, on the assumption that they in turn
@@ -547,7 +729,7 @@ class LimpetKsock(Ksock):
             msg.msg.to = replier_id
 
         if self.verbosity > 1:
-            print '%s Adjusted the msg.to field'%hdr
+            print('%s Adjusted the msg.to field'%hdr)
 
         return msg
 
@@ -587,36 +769,44 @@ class LimpetKsock(Ksock):
         Raises ErrorMessage(<error message>) if we should send <error message> to
         the other Limpet.
         """
-        kbus_name  = 'KBUS%u'%self._ksock_id
-        limpet_name = 'Limpet%d'%self.other_network_id
-        limpet_to_us_hdr  = '%u %s->Us%s'%(self.network_id, limpet_name, ' '*(len(kbus_name)-2))
-        nowt_to_kbus_hdr   = '%u %s->%s'%(self.network_id, ' '*len(limpet_name), kbus_name)
-        spaces_hdr = ' '*len(limpet_to_us_hdr)
-
-        if self.verbosity > 1:
-            print '%s %s'%(limpet_to_us_hdr, str(msg))
+        # Only build our report headers if we're going to report anything
+        verbose = self.verbosity > 1
+        if verbose:
+            kbus_name  = 'KBUS%u'%self._ksock_id
+            limpet_name = 'Limpet%d'%self.other_network_id
+            limpet_to_us_hdr  = '%u %s->Us%s'%(self.network_id, limpet_name, ' '*(len(kbus_name)-2))
+            spaces_hdr = ' '*len(limpet_to_us_hdr)
+            print('%s %s'%(limpet_to_us_hdr, str(msg)))
+        else:
+            spaces_hdr = ''
 
-        if msg.name == '$.KBUS.ReplierBindEvent':
+        if msg.msg.name_len == _REPLIER_BIND_EVENT_LEN and \
+           msg.name == _REPLIER_BIND_EVENT:
+            self._replier_cache.clear()
             # We have to bind/unbind as a Replier in proxy
             is_bind, binder_id, name = split_replier_bind_event_data(msg.data)
             if is_bind:
-                if self.verbosity > 1:
-                    print '%s BIND "%s'%(spaces_hdr,name)
+                if verbose:
+                    print('%s BIND "%s'%(spaces_hdr,name))
                 super(LimpetKsock, self).bind(name, True)
                 self.replier_for[name] = binder_id
             else:
-                if self.verbosity > 1:
-                    print '%s UNBIND "%s'%(spaces_hdr,name)
+                if verbose:
+                    print('%s UNBIND "%s'%(spaces_hdr,name))
                 super(LimpetKsock, self).unbind(name, True)
                 del self.replier_for[name]
             return None
 
-        if msg.is_reply():                   # a Reply (or Status)
+        hdr = msg.msg
+        in_reply_to = hdr.in_reply_to
+        if in_reply_to.network_id or in_reply_to.serial_num:
+            # a Reply (or Status)
             try:
                 msg = self._amend_reply_from_socket(spaces_hdr, msg)
             except KeyError:
                 return None
-        elif msg.is_stateful_request() and msg.wants_us_to_reply():
+        elif hdr.flags & _REQUEST_FOR_US == _REQUEST_FOR_US and hdr.to:
+            # a Stateful Request that wants us to reply
             msg = self._amend_request_from_socket(spaces_hdr, msg)
 
         return msg
@@ -635,21 +825,18 @@ class LimpetKsock(Ksock):
         # If we were sending a Request, we need to fake an
         # appropriate Reply.
         if msg.is_request():
-            try:
-                errname = '$.KBUS.RemoteError.%s'%errno.errorcode[exc.errno]
-            except KeyError:
+            errname = _REMOTE_ERROR_NAMES.get(exc.errno)
+            if errname is None:
                 errname = '$.KBUS.RemoteError.%d'%exc.errno
             if self.verbosity > 1:
-                print '%s *** Remote error %s'%(nowt_to_kbus_hdr, errname)
-            error = Message(errname, to=msg.from_, in_reply_to=msg.id)
-            self.write_message_to_other_limpet(error)
-            return error
+                print('%u *** Remote error %s'%(self.network_id, errname))
+            return Message(errname, to=msg.from_, in_reply_to=msg.id)
         #
         # If we were sending a Reply, we need to think whether we
         # can do anything useful...
         #
         # XXX TODO
-        print '%u send_msg: %s -- continuing'%(self.network_id, exc)
+        print('%u send_msg: %s -- continuing'%(self.network_id, exc))
         return None
 
 
@@ -658,34 +845,30 @@ def serialise_message_header(msg):
 
     Does not touch the message data in any way.
 
-    Returns the serialised array. Note that this omits the name pointer and
-    data pointer fields.
+    Returns the serialised header, as a string. Note that this omits the name
+    pointer and data pointer fields.
     """
-    array = _SerialisedMessageHeaderType()
-    array[0]  = msg.msg.start_guard
-    array[1]  = msg.msg.id.network_id
-    array[2]  = msg.msg.id.serial_num
-    array[3]  = msg.msg.in_reply_to.network_id
-    array[4]  = msg.msg.in_reply_to.serial_num
-    array[5]  = msg.msg.to
-    array[6]  = msg.msg.from_
-    array[7]  = msg.msg.orig_from.network_id
-    array[8]  = msg.msg.orig_from.local_id
-    array[9]  = msg.msg.final_to.network_id
-    array[10] = msg.msg.final_to.local_id
-    array[11] = msg.msg.extra                # to save adding it in the future
-    array[12] = msg.msg.flags
-    array[13] = msg.msg.name_len
-    array[14] = msg.msg.data_len
+    hdr = msg.msg
     # There's no point in sending the name and data pointers - since we must
     # be sending an "entire" message, they must be NULL, and anyway they're
     # pointers...
-    array[15] = msg.msg.end_guard
-
-    for ii, item in enumerate(array):
-        array[ii] = htonl(item)
-
-    return array
+    return _SerialisedMessageHeaderStruct.pack(
+            hdr.start_guard,
+            hdr.id.network_id,
+            hdr.id.serial_num,
+            hdr.in_reply_to.network_id,
+            hdr.in_reply_to.serial_num,
+            hdr.to,
+            hdr.from_,
+            hdr.orig_from.network_id,
+            hdr.orig_from.local_id,
+            hdr.final_to.network_id,
+            hdr.final_to.local_id,
+            hdr.extra,                  # to save adding it in the future
+            hdr.flags,
+            hdr.name_len,
+            hdr.data_len,
+            hdr.end_guard)
 
 def unserialise_message_header(data):
     """Unserialise a message header from integers read from the network.
@@ -694,11 +877,10 @@ def unserialise_message_header(data):
     serialise_message_header() (in particular, omitting the name and data
     pointer fields).
 
-    Returns (name_len, data_len, array)
+    Returns (name_len, data_len, array), where 'array' is a tuple of the
+    header fields.
     """
-    array = _struct_from_bytes(_SerialisedMessageHeaderType, data)
-    for ii, item in enumerate(array):
-        array[ii] = ntohl(array[ii])
+    array = _SerialisedMessageHeaderStruct.unpack_from(data)
     return array[13], array[14], array
 
 def convert_ReplierBindEvent_data_from_network(data, data_len):
@@ -750,8 +932,13 @@ class LimpetExample(object):
     any changes when (if) it closes.
     """
 
+    # We look at these on every message, so avoid the per-instance dictionary
+    __slots__ = ('sock', 'verbosity', 'message_name', 'other_network_id',
+                 'replier_for', 'our_requests', 'wrapper', 'ksock_id',
+                 '_read_buf', '_epoll', '_coalesce_us', '_coalesce_max_us')
+
     def __init__(self, which, sock, network_id, message_name='$.*', verbosity=1,
-                 termination_message=None):
+                 termination_message=None, coalesce_max_us=0):
         """A Limpet has two "ends":
 
         1. 'which' specifies which KBUS device it should communicate
@@ -774,12 +961,19 @@ class LimpetExample(object):
           information about each message as it is processed.
         - if termination_message is non-None, then when we read this message,
           the reading method will raise GiveUp.
+        - if coalesce_max_us is greater than zero, then when we have read all
+          the messages KBUS has for us, we may wait up to that many
+          microseconds for more, so we can send them to the other Limpet
+          together. How long we actually wait adapts to how busy KBUS is:
+          longer when we keep filling our send buffer, shorter when nothing
+          more arrives. The default, 0, means we never wait.
         """
         if network_id < 1:
             raise ValueError('Limpet network id must be > 0, not %d'%network_id)
 
         self.sock = sock
         self.verbosity = verbosity
+        self.message_name = message_name
 
         # We don't know the network id of our Limpet pair yet
         self.other_network_id = None
@@ -793,6 +987,15 @@ class LimpetExample(object):
         # the key, and the from/to information as the data
         self.our_requests = {}
 
+        # The buffer we read messages from the other Limpet into. We make it
+        # bigger if we need to.
+        self._read_buf = bytearray(_SERIALISED_MESSAGE_HEADER_LEN*4)
+
+        # How long we currently wait for more messages from KBUS, and the
+        # longest we are allowed to wait
+        self._coalesce_us = 0
+        self._coalesce_max_us = coalesce_max_us
+
         # So we're set up to talk at both ends - now sort out what we're
         # talking about
 
@@ -806,38 +1009,45 @@ class LimpetExample(object):
             raise GiveUp('This Limpet and its pair both have'
                          ' network id %d'%network_id)
         if self.verbosity > 1:
-            print 'Other Limpet has network id',other_network_id
+            print('Other Limpet has network id',other_network_id)
 
         self.wrapper = LimpetKsock(which, network_id, other_network_id,
                                    message_name, verbosity, termination_message)
         self.ksock_id = self.wrapper.ksock_id()
 
+        # We wait on both our Ksock and the other Limpet's socket, for as
+        # long as we run, so only register them the once
+        self._epoll = select.epoll()
+        self._epoll.register(self.wrapper.fileno(), select.EPOLLIN)
+        self._epoll.register(self.sock.fileno(), select.EPOLLIN)
+
     def _send_network_id(self, network_id):
         """Send our pair Limpet our network id.
         """
-        self.sock.sendall('HELO')
-        data = struct.pack('!L', network_id)   # unsigned long, network order
-        self.sock.sendall(data)
+        # 'HELO' and then an unsigned long, network order, all in one go
+        self.sock.sendall(_HelloStruct.pack('HELO', network_id))
 
     def _read_network_id(self):
         """Read our pair Limpet's network id.
         """
-        hello = self.sock.recv(4, socket.MSG_WAITALL)
-        if hello == '':
-          raise OtherLimpetGoneAway()
-        elif hello != 'HELO':
+        # 'HELO' and then an unsigned long, network order, all in one go
+        buf = self._read_buf
+        self._recv_into(memoryview(buf)[:_HelloStruct.size])
+        hello, network_id = _HelloStruct.unpack_from(buf)
+        if hello != 'HELO':
             raise BadMessage("Expected 'HELO' to announce other limpet,"
                              " got '%s'"%hello)
-
-        data = self.sock.recv(4, socket.MSG_WAITALL)
-        return struct.unpack('!L', data)[0]   # unsigned long, network order
+        return network_id
 
 
     def close(self):
         """Tidy up when we're finished.
         """
+        if self._epoll is not None:
+            self._epoll.close()
+            self._epoll = None
         if self.verbosity:
-            print 'Limpet closed'
+            print('Limpet closed')
 
     def __repr__(self):
         sf = {socket.AF_INET:'socket.AF_INET',
@@ -857,6 +1067,16 @@ class LimpetExample(object):
         return 'Limpet from KBUS Ksock %u via socket %s'%(self.ksock_id,
                                                           self.sock)
 
+    def _recv_into(self, view):
+        """Fill the memoryview `view` with data from the other Limpet.
+        """
+        recv_into = self.sock.recv_into
+        while len(view):
+            count = recv_into(view, len(view), socket.MSG_WAITALL)
+            if count == 0:
+                raise OtherLimpetGoneAway()
+            view = view[count:]
+
     def read_message_from_other_limpet(self):
         """Read a message from the other Limpet.
 
@@ -864,12 +1084,10 @@ class LimpetExample(object):
         """
 
         # First, read the message header
-        header = self.sock.recv(_SERIALISED_MESSAGE_HEADER_LEN*4,
-                                socket.MSG_WAITALL)
-        if header == '':
-            raise OtherLimpetGoneAway()
+        buf = self._read_buf
+        self._recv_into(memoryview(buf)[:_SERIALISED_MESSAGE_HEADER_LEN*4])
 
-        name_len, data_len, array = unserialise_message_header(header)
+        name_len, data_len, array = unserialise_message_header(buf)
 
         if array[0] != Message.START_GUARD:
             raise BadMessage('Message data start guard is %08x,'
@@ -879,34 +1097,42 @@ class LimpetExample(object):
             raise BadMessage('Message data end guard is %08x,'
                          ' not %08x'%(array[-1],Message.END_GUARD))
 
-        name = self.sock.recv(calc_padded_name_len(name_len),
-                              socket.MSG_WAITALL)
-        if name == '':
-            raise OtherLimpetGoneAway()
-
+        # Now we know how long the rest of the message is, we can read the
+        # name, data and final end guard all in one go
+        padded_name_len = calc_padded_name_len(name_len)
         if data_len:
-            data = self.sock.recv(calc_padded_data_len(data_len),
-                                  socket.MSG_WAITALL)
-            if data == '':
-                raise OtherLimpetGoneAway()
+            padded_data_len = calc_padded_data_len(data_len)
+        else:
+            padded_data_len = 0
+        rest_len = padded_name_len + padded_data_len + 4
+        if len(buf) < rest_len:
+            # At least double it, so a run of gradually longer messages
+            # doesn't mean reallocating for each one
+            buf = self._read_buf = bytearray(max(rest_len, 2*len(buf)))
+        view = memoryview(buf)
+        self._recv_into(view[:rest_len])
+
+        # Slicing the memoryview (rather than the bytearray) means we only
+        # copy the name and data once, as we make strings of them
+        name = view[:name_len].tobytes()
+        if data_len:
+            data = view[padded_name_len:padded_name_len+data_len].tobytes()
         else:
             data = None
 
-        end = self.sock.recv(4, socket.MSG_WAITALL)
-        #value = struct.unpack('!L', end)   # unsigned long, network order
-        #end = ntohl(value[0])
-        end = struct.unpack('!L', end)[0]   # unsigned long, network order
+        # unsigned long, network order
+        end = _EndGuardStruct.unpack_from(buf, padded_name_len+padded_data_len)[0]
         if end != Message.END_GUARD:
             raise BadMessage('Final message data end guard is %08x,'
                          ' not %08x'%(end,Message.END_GUARD))
 
         # We know enough to sort out the network order of the integers in
         # the Replier Bind Event's data
-        if name[:name_len] == '$.KBUS.ReplierBindEvent':
+        if name == _REPLIER_BIND_EVENT:
             data = convert_ReplierBindEvent_data_from_network(data, data_len)
         
-        return Message(name[:name_len],
-                       data=data[:data_len] if data else None,
+        return Message(name,
+                       data=data,
                        id=MessageId(array[1],array[2]),
                        in_reply_to=MessageId(array[3],array[4]),
                        to=array[5], from_=array[6],
@@ -917,29 +1143,72 @@ class LimpetExample(object):
     def write_message_to_other_limpet(self, msg):
         """Write a Message to the other Limpet.
         """
+        self.sock.sendall(self._serialise_message(msg))
+
+    def _serialise_message(self, msg, data=None):
+        """Add a Message, as the bytes we write to the other Limpet, to 'data'.
+
+        'data' should be a bytearray, which we extend. If it is None, we
+        start a new one. Either way, we return it.
+
+        Appending each message to the buffer that is going to be sent means
+        it doesn't need a buffer of its own, nor copying from that.
+        """
+        if data is None:
+            data = bytearray()
+
+        name = msg.name
+
         # We know enough to sort out the network order of the integers in
         # the Replier Bind Event's data
-        if msg.name == '$.KBUS.ReplierBindEvent':
-            data = convert_ReplierBindEvent_data_to_network(msg.data)
-            msg = Message.from_message(msg, data=data)
+        if name == _REPLIER_BIND_EVENT:
+            rbe_data = convert_ReplierBindEvent_data_to_network(msg.data)
+            msg = Message.from_message(msg, data=rbe_data)
 
-        header = serialise_message_header(msg)
-        self.sock.sendall(header)
+        data += serialise_message_header(msg)
 
-        self.sock.sendall(msg.name)
-        padded_name_len = calc_padded_name_len(msg.msg.name_len)
-        if len(msg.name) != padded_name_len:
-            self.sock.sendall('\0'*(padded_name_len - len(msg.name)))
+        data += name
+        data += _ZEROS[:calc_padded_name_len(msg.msg.name_len) - len(name)]
 
         if msg.msg.data_len:
-            self.sock.sendall(msg.data)
-            padded_data_len = calc_padded_data_len(msg.msg.data_len)
-            if len(msg.data) != padded_data_len:
-                self.sock.sendall('\0'*(padded_data_len - len(msg.data)))
+            msg_data = msg.data
+            data += msg_data
+            data += _ZEROS[:calc_padded_data_len(msg.msg.data_len) - len(msg_data)]
+
+        data += _END_GUARD              # end guard again
+        return data
+
+    def _more_from_other_limpet(self):
+        """Is there more data waiting to be read from the other Limpet?
 
-        ##end_guard = struct.pack('!L', header[-1])
-        end_guard = struct.pack('!L', Message.END_GUARD)
-        self.sock.sendall(end_guard)       # end guard again
+        If the other Limpet has gone away, we say there is, so that trying
+        to read it will find that out.
+        """
+        try:
+            self.sock.recv(1, socket.MSG_PEEK | socket.MSG_DONTWAIT)
+            return True
+        except socket.error as exc:
+            if exc.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return False
+            raise
+
+    def _wait_for_more_from_kbus(self, ksock_fd):
+        """Wait (briefly) in case KBUS has more messages for us.
+
+        Returns True if it does. If the wait times out, we shall wait less
+        next time. If the other Limpet has sent us something instead, we
+        stop waiting so that can be dealt with.
+        """
+        wait_us = self._coalesce_us
+        if not wait_us:
+            return False
+        events = self._epoll.poll(wait_us / 1000000.0)
+        for fd, event in events:
+            if fd == ksock_fd:
+                return True
+        if not events:
+            self._coalesce_us = max(0, wait_us - _COALESCE_STEP_US)
+        return False
 
     def run_forever(self):
         """Or until we're interrupted, or read the termination message from KBUS.
@@ -947,40 +1216,98 @@ class LimpetExample(object):
         If an exception is raised, then the Limpet is closed as the method
         is exited.
         """
+        ksock_fd = self.wrapper.fileno()
+        sock_fd = self.sock.fileno()
+        poll = self._epoll.poll
+
+        # Look up the methods we call for every message just the once
+        wrapper = self.wrapper
+        network_id = wrapper.network_id
+        next_msg = wrapper.next_msg
+        read_msg = wrapper.read_msg
+        send_msg = wrapper.send_msg
+        sendall = self.sock.sendall
+        serialise_message = self._serialise_message
+        read_message_from_other_limpet = self.read_message_from_other_limpet
+        more_from_other_limpet = self._more_from_other_limpet
+        wait_for_more_from_kbus = self._wait_for_more_from_kbus
+        verbose = self.verbosity > 1
         try:
             while 1:
                 # Wait for a message written to us, with no timeout
                 # (at least for the moment)
-                (r, w, x) = select.select( [self.wrapper, self.sock], [], [])
+                r = [fd for fd, event in poll()]
 
-                if self.verbosity > 1:
-                    print
-
-                if self.wrapper in r:
-                    print '%u ---------------------- Message from KBUS'% \
-                            self.wrapper.network_id
-                    msg = self.wrapper.read_next_msg()
-                    if msg is not None:
-                        self.write_message_to_other_limpet(msg)
-
-                if self.sock in r:
-                    print '%u ---------------------- Message from other Limpet'% \
-                            self.wrapper.network_id
-                    msg = self.read_message_from_other_limpet()
-                    print '%u %s'%(self.wrapper.network_id,msg)
+                if verbose:
+                    print()
+
+                if ksock_fd in r:
+                    # Read all the messages KBUS has for us, and send them
+                    # on to the other Limpet together
+                    data = bytearray()
                     try:
-                        msg_id = self.wrapper.send_msg(msg)
-                        print '%u msg_id %s'%(self.wrapper.network_id,msg_id)
-                    except NoMessage as exc:
-                        # It turned out to be a message we should ignore - do so
-                        print '%u IGNORED %s'%(self.wrapper.network_id,msg)
-                    except ErrorMessage as exc:
-                        self.write_message_to_other_limpet(exc.error)
-                    except IOError as exc:
-                        error = self.wrapper.could_not_send_to_kbus_msg(msg, exc)
-                        if error is not None:
-                            self.write_message_to_other_limpet(error)
-                            return
+                        while 1:
+                            length = next_msg()
+                            if not length:
+                                if data and wait_for_more_from_kbus(ksock_fd):
+                                    continue
+                                break
+                            if verbose:
+                                print('%u ---------------------- Message from KBUS'%
+                                        network_id)
+                            msg = read_msg(length)
+                            if msg is not None:
+                                serialise_message(msg, data)
+                                if len(data) >= _COALESCE_BYTES:
+                                    # Enough to be going on with - and it
+                                    # looks as if we can afford to wait
+                                    # longer for more next time
+                                    sendall(data)
+                                    data = bytearray()
+                                    self._coalesce_us = min(self._coalesce_max_us,
+                                                            self._coalesce_us +
+                                                            _COALESCE_STEP_US)
+                    except GiveUp:
+                        # Don't lose the messages from before the termination
+                        # message
+                        if data:
+                            sendall(data)
+                        raise
+                    if data:
+                        sendall(data)
+
+                if sock_fd in r:
+                    # And read all the messages the other Limpet has sent us,
+                    # gathering up any errors we need to send back to it so
+                    # they also go in one write
+                    errors = bytearray()
+                    while 1:
+                        if verbose:
+                            print('%u ---------------------- Message from other Limpet'%
+                                    network_id)
+                        msg = read_message_from_other_limpet()
+                        if verbose:
+                            print('%u %s'%(network_id,msg))
+                        try:
+                            msg_id = send_msg(msg)
+                            if verbose:
+                                print('%u msg_id %s'%(network_id,msg_id))
+                        except NoMessage as exc:
+                            # It turned out to be a message we should ignore - do so
+                            if verbose:
+                                print('%u IGNORED %s'%(network_id,msg))
+                        except ErrorMessage as exc:
+                            serialise_message(exc.error, errors)
+                        except IOError as exc:
+                            error = wrapper.could_not_send_to_kbus_msg(msg, exc)
+                            if error is not None:
+                                serialise_message(error, errors)
+                                sendall(errors)
+                                return
+                        if not more_from_other_limpet():
+                            break
+                    if errors:
+                        sendall(errors)
         finally:
             self.close()
 
@@ -989,15 +1316,21 @@ class LimpetExample(object):
         return self
 
     def __exit__(self, etype, value, tb):
-        if tb is None:
-            # No exception, so just finish normally
-            self.close()
-        else:
-            # An exception occurred, so do any tidying up necessary
-            # - well, there isn't anything special to do, really
-            self.close()
-            # And allow the exception to be re-raised
-            return False
+        # Whether or not an exception occurred, there isn't anything
+        # special to do other than close ourselves
+        self.close()
+        # And allow any exception to be re-raised
+        return False
+
+def _disable_nagle(sock, family):
+    """Send small writes on an internet socket straight away.
+
+    Limpet messages are small, and often part of a Request/Reply exchange,
+    so we don't want Nagle's algorithm holding them back. Unix domain
+    sockets don't do that anyway.
+    """
+    if family == socket.AF_INET:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
 def connect_as_server(address, family, verbosity=1):
     """Connect to a socket as a server.
@@ -1007,7 +1340,7 @@ def connect_as_server(address, family, verbosity=1):
     Returns a tuple (listener_socket, connection_socket).
     """
     if verbosity > 1:
-        print 'Listening on', address
+        print('Listening on', address)
 
     listener = socket.socket(family, socket.SOCK_STREAM)
     # Try to allow address reuse as soon as possible after we've finished
@@ -1015,11 +1348,14 @@ def connect_as_server(address, family, verbosity=1):
     listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     listener.bind(address)
 
+    # We only ever talk to the one other Limpet, so there's no point in
+    # a longer backlog
     listener.listen(1)
     connection, address = listener.accept()
+    _disable_nagle(connection, family)
 
     if verbosity:
-        print 'Connection accepted from (%s, %s)'%(connection, address)
+        print('Connection accepted from (%s, %s)'%(connection, address))
 
     return (listener, connection)
 
@@ -1036,9 +1372,10 @@ def connect_as_client(address, family, verbosity=1):
     try:
         sock = socket.socket(family, socket.SOCK_STREAM)
         sock.connect(address)
+        _disable_nagle(sock, family)
 
         if verbosity:
-            print 'Connected to "%s" as client'%sockname
+            print('Connected to "%s" as client'%sockname)
 
         return sock
     except Exception as exc:
@@ -1056,7 +1393,8 @@ def remove_socket_file(name):
         raise GiveUp('Unable to delete socket file "%s": %s'%(name, err))
 
 def run_a_limpet(is_server, address, family, kbus_device, network_id,
-                 message_name='$.*', termination_message=None, verbosity=1):
+                 message_name='$.*', termination_message=None, verbosity=1,
+                 coalesce_max_us=0):
     """Run a Limpet.
 
     A Limpet has two "ends":
@@ -1091,15 +1429,19 @@ def run_a_limpet(is_server, address, family, kbus_device, network_id,
     - if `verbosity` is 0, we don't output any "useful" messages, if it is
       1 we just announce ourselves, if it is 2 (or higher) we output
       information about each message as it is processed.
+    - if `coalesce_max_us` is greater than zero, it is the longest time (in
+      microseconds) we may wait for more messages from KBUS, so that we can
+      send them to the other Limpet together. See :class:`LimpetExample`.
     """
     if family not in (socket.AF_UNIX, socket.AF_INET):
         raise ValueError('Socket family is %d, must be AF_UNIX (%s) or'
                          ' AF_INET (%d)'%(family,
                                           socket.AF_UNIX, socket.AF_INET))
 
-    print 'Python Limpet: %s via %s for KBUS %d,' \
-          ' using network id %d'%('Server' if is_server else 'Client',
-                                  address, kbus_device, network_id)
+    if verbosity:
+        print('Python Limpet: %s via %s for KBUS %d,'
+              ' using network id %d'%('Server' if is_server else 'Client',
+                                      address, kbus_device, network_id))
 
     if is_server:
         listener, sock = connect_as_server(address, family, verbosity)
@@ -1109,22 +1451,22 @@ def run_a_limpet(is_server, address, family, kbus_device, network_id,
     try:
         # The proposed new mechanism
         with LimpetExample(kbus_device, sock, network_id, message_name, verbosity,
-                     termination_message) as l:
+                     termination_message, coalesce_max_us) as l:
             if verbosity:
-                print l
+                print(l)
                 if termination_message:
-                    print "Terminate by sending a message named '%s'"%termination_message
+                    print("Terminate by sending a message named '%s'"%termination_message)
             l.run_forever()
     except Exception as exc:
         if verbosity > 1:
-            print 'Closing socket'
+            print('Closing socket')
         if not is_server:
             sock.shutdown(socket.SHUT_RDWR)
         sock.close()
 
         if is_server:
             if verbosity > 1:
-                print 'Closing listener socket'
+                print('Closing listener socket')
             listener.close()
             if family == socket.AF_UNIX:
                 remove_socket_file(address)
@@ -1134,15 +1476,29 @@ def parse_address(word):
     """Work out what sort of address we have.
 
     Returns (address, family).
+
+    An explicit ``unix:<path>`` or ``tcp://<host>:<port>`` says which we
+    mean, which allows for paths that contain a colon. Raises ValueError if
+    there is nothing after the ``unix:`` or ``tcp://``.
     """
-    if ':' in word:
-        try:
-            host, port = word.split(':')
-            port = int(port)
-            address = host, port
-            family = socket.AF_INET
-        except Exception as exc:
-            raise GiveUp('Unable to interpret "%s" as <host>:<port>: %s'%(word, exc))
+    if word.startswith('unix:'):
+        if word == 'unix:':
+            raise ValueError('No path given after "unix:"')
+        return word[5:], socket.AF_UNIX
+    if word.startswith('tcp://'):
+        word = word[6:]
+        if not word:
+            raise ValueError('No <host>:<port> given after "tcp://"')
+        if ':' not in word:
+            raise GiveUp('Unable to interpret "tcp://%s" as'
+                         ' tcp://<host>:<port>'%word)
+
+    host, colon, port = word.rpartition(':')
+    if colon:
+        if not port.isdigit() or ':' in host:
+            raise GiveUp('Unable to interpret "%s" as <host>:<port>'%word)
+        address = host, int(port)
+        family = socket.AF_INET
     else:
         # Assume it's a valid pathname (!)
         address = word
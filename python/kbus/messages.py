@@ -243,9 +243,16 @@ def c_data_as_string(data, data_len):
         w.append(chr(data[ii]))
     return ''.join(w)
 
+# How hexdata() represents each possible byte value
+_HEXDATA_PRETTY = string.letters + string.digits + string.punctuation
+_HEXDATA_TABLE = tuple([chr(ch) if chr(ch) in _HEXDATA_PRETTY else '\\x%02x'%ch
+                        for ch in range(256)])
+
 def hexdata(data):
     r"""Return a representation of a 'string' in printable form.
 
+    A memoryview (such as :attr:`Message.data_view`) is also acceptable.
+
     Doesn't use whitespace or anything not in letters, digits or punctuation.
     Thus, the resultant string should be entirely equivalent in "meaning" to
     the input.
@@ -262,15 +269,17 @@ def hexdata(data):
         "'"
         >>> hexdata('\x03')
         '\\x03'
+
+    Unicode strings are handled a character at a time, as they always were:
+
+        >>> hexdata(u'a\x03\u1234')
+        u'a\\x03\\x1234'
     """
-    pretty = string.letters + string.digits + string.punctuation
-    words = []
-    for ch in data:
-        if ch in pretty:
-            words.append(ch)
-        else:
-            words.append('\\x%02x'%ord(ch))
-    return ''.join(words)
+    if isinstance(data, unicode):
+        return ''.join([ch if ch in _HEXDATA_PRETTY else '\\x%02x'%ord(ch)
+                        for ch in data])
+    table = _HEXDATA_TABLE
+    return ''.join([table[ch] for ch in bytearray(data)])
 
 def hexify(data):
     r"""Return a representation of a 'string' as hex values.
@@ -289,6 +298,19 @@ def hexify(data):
         words.append('%02x'%ord(ch))
     return ' '.join(words)
 
+def _data_repr(data):
+    """Return a representation of (actual) message data, for use in a __repr__.
+    """
+    return repr(hexdata(data))
+
+def _repr_args(name, data):
+    """Return the name and (any) data arguments for a message __repr__.
+    """
+    if data is None:
+        return [repr(name)]
+    else:
+        return [repr(name), 'data=%s'%_data_repr(data)]
+
 def _int_tuple_as_str(data):
     """Return a representation of a tuple of integers, as a string.
     """
@@ -329,17 +351,17 @@ class _MessageHeaderStruct(ctypes.Structure):
     def __repr__(self):
         """For debugging, not construction of an instance of ourselves.
         """
-        if self.name == None:
+        if self.name is None:
             nn = 'None'
         else:
             nn = repr(hexdata(self.name))
-        if self.data == None:
+        # A NULL pointer is false, but is never equal to None
+        if not self.data:
             dd = 'None'
         else:
             # We need to retrieve our data from the pointer - ick
             p = ctypes.cast(self.data, ctypes.POINTER(ctypes.c_uint8*self.data_len))
-            s = ctypes.string_at(p, self.data_len)
-            dd = repr(hexdata(s))
+            dd = _data_repr(memoryview(p.contents))
         return "<%08x] %s %s %u %u %s %s %08x %u %u %s %s [%08x>"%(
                 self.start_guard,
                 self.id._short_str(),
@@ -394,6 +416,12 @@ def _struct_from_bytes(struct_class, data):
 
 MSG_HEADER_LEN = ctypes.sizeof(_MessageHeaderStruct)
 
+# For reading just the start guard, and the name and data lengths, from the
+# bytes of a message header, without building a whole header structure
+_StartGuardStruct = struct.Struct('=L')
+_NameAndDataLenStruct = struct.Struct('=LL')
+_NAME_LEN_OFFSET = _MessageHeaderStruct.name_len.offset
+
 def calc_padded_name_len(name_len):
     """Calculate the length of a message name, in bytes, after padding.
 
@@ -418,6 +446,17 @@ def calc_entire_message_len(name_len, data_len):
     return MSG_HEADER_LEN + calc_padded_name_len(name_len) + \
                             calc_padded_data_len(data_len) + 4
 
+def calc_entire_message_buffer_len(length):
+    """Calculate how big a buffer is needed to hold an "entire" message.
+
+    'length' is the "entire" message length (as, for instance, returned by
+    :meth:`Ksock.next_msg`). The result allows for any padding that the C
+    datastructure has after the final end guard (so, for instance, 4 more
+    bytes on a 64-bit machine).
+    """
+    align = ctypes.alignment(_MessageHeaderStruct)
+    return align * ((length + align - 1) // align)
+
 def message_from_parts(id, in_reply_to, to, from_, orig_from, final_to, flags, name, data):
     """Return a new Message header structure, with name and data attached.
 
@@ -522,7 +561,7 @@ class _EntireMessageStructBaseclass(ctypes.Structure):
         else:
             name_repr = 'None'
         if self.data_len:
-            data_repr = repr(hexdata(c_data_as_string(self.rest_data,self.data_len)))
+            data_repr = _data_repr(memoryview(self.rest_data)[:self.data_len])
         else:
             data_repr = None
         return "%s %s %s [%08x>"%(
@@ -736,7 +775,7 @@ def _entire_message_from_bytes(data):
     if len(data) < MSG_HEADER_LEN:
         raise ValueError('Cannot form entire message from string'
                          ' "%s" of length %d'%(hexdata(data),len(data)))
-    if struct.unpack('=L',data[:4])[0] != Message.START_GUARD:
+    if _StartGuardStruct.unpack_from(data)[0] != Message.START_GUARD:
         raise ValueError('Cannot form entire message from string "%s..%s"'
                          ' which does not start with message start'
                          ' guard'%(hexdata(data[:8]),hexdata(data[-8:])))
@@ -746,24 +785,26 @@ def _entire_message_from_bytes(data):
         print
         print '_entire_message_from_bytes(%d:%s)'%(len(data),hexify(data))
     ## ===================================
-    h = _struct_from_bytes(_MessageHeaderStruct, data)
+    name_len, data_len = _NameAndDataLenStruct.unpack_from(data,
+                                                           _NAME_LEN_OFFSET)
     ## ===================================
     if debug:
+        h = _struct_from_bytes(_MessageHeaderStruct, data)
         print '_MessageHeaderStruct: %s'%h
     ## ===================================
 
     # Don't forget that the string will be terminated with a 0 byte
-    padded_name_len = calc_padded_name_len(h.name_len)
+    padded_name_len = calc_padded_name_len(name_len)
 
     # But not so the data
-    padded_data_len = calc_padded_data_len(h.data_len)
+    padded_data_len = calc_padded_data_len(data_len)
 
     local_class = _specific_entire_message_struct(padded_name_len,
                                                   padded_data_len)
 
     ## ===================================
     if debug:
-        print 'name_len %d -> %d, data_len %d -> %d'%(h.name_len, padded_name_len, h.data_len, padded_data_len)
+        print 'name_len %d -> %d, data_len %d -> %d'%(name_len, padded_name_len, data_len, padded_data_len)
         x = _struct_from_bytes(local_class, data)
         print '_specific_class:      %s'%x
         print
@@ -771,6 +812,30 @@ def _entire_message_from_bytes(data):
 
     return _struct_from_bytes(local_class, data)
 
+def _entire_message_from_buffer(buf):
+    """Return a message structure that uses the memory in 'buf' directly.
+
+    'buf' is a writable buffer (for instance, a bytearray) containing an entire
+    message. The message is not copied, so 'buf' must not be reused for
+    anything else afterwards.
+
+    'buf' must be at least as long as the message structure, which may be
+    slightly longer than the message itself - see
+    :func:`calc_entire_message_buffer_len`.
+    """
+    if len(buf) < MSG_HEADER_LEN:
+        raise ValueError('Cannot form entire message from buffer'
+                         ' "%s" of length %d'%(hexdata(buf),len(buf)))
+    h = _MessageHeaderStruct.from_buffer(buf)
+    if h.start_guard != Message.START_GUARD:
+        raise ValueError('Cannot form entire message from buffer "%s..%s"'
+                         ' which does not start with message start'
+                         ' guard'%(hexdata(buf[:8]),hexdata(buf[-8:])))
+    local_class = _specific_entire_message_struct(
+                                    calc_padded_name_len(h.name_len),
+                                    calc_padded_data_len(h.data_len))
+    return local_class.from_buffer(buf)
+
 class Message(object):
     r"""A wrapper for a KBUS message
 
@@ -962,6 +1027,9 @@ class Message(object):
     ALL_OR_WAIT         = _BIT(8)
     ALL_OR_FAIL         = _BIT(9)
 
+    # (msg, data) for the last time the `data` property was asked for
+    _data_cache = None
+
     def __init__(self, name, data=None, to=None, from_=None, orig_from=None,
                  final_to=None, in_reply_to=None, flags=None, id=None):
         """Initialise a Message.
@@ -1042,6 +1110,29 @@ class Message(object):
         message.msg = _entire_message_from_bytes(arg)
         return message
 
+    @staticmethod
+    def from_buffer(buf):
+        """Construct a :class:`Message` that uses the memory in `buf` directly.
+
+        This is like :meth:`from_bytes`, except that the message data is not
+        copied - `buf` must be a writable buffer (such as a bytearray), and
+        must not be reused for anything else afterwards. It must also be long
+        enough - see :func:`calc_entire_message_buffer_len`.
+
+        For instance:
+
+            >>> msg1 = Message('$.Fred', '12345678')
+            >>> data = msg1.to_bytes()
+            >>> buf = bytearray(calc_entire_message_buffer_len(len(data)))
+            >>> buf[:len(data)] = data
+            >>> msg2 = Message.from_buffer(buf)
+            >>> msg2
+            Message('$.Fred', data='12345678')
+        """
+        message = Message.__new__(Message,'')
+        message.msg = _entire_message_from_buffer(buf)
+        return message
+
     def _merge_args(self, extracted, this_data, this_to, this_from_,
                     this_orig_from, this_final_to, this_in_reply_to,
                     this_flags, this_id):
@@ -1121,10 +1212,8 @@ class Message(object):
                              " (e.g., '$.*')"%self.msg.name_len)
 
     def __repr__(self):
-        (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self.extract()
-        args = [repr(name)]
-        if data is not None:
-            args.append('data=%s'%repr(hexdata(data)))
+        (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self._extract_view()
+        args = _repr_args(name, data)
         if to:
             args.append('to=%s'%repr(to))
         if from_:
@@ -1398,11 +1487,47 @@ class Message(object):
 	"""
 	Returns the payload of this KBUS message as a Python string, 
 	or None if it is not present.
+
+        The string is only built the first time it is asked for - after
+        that, the same string is returned until `msg` is replaced. Use
+        :attr:`data_view` to look at the data without copying it at all.
 	"""
-        if self.msg.data_len == 0:
+        msg = self.msg
+        if msg.data_len == 0:
             return None
-        # To be friendly, return data as a Python (byte) string
-        return c_data_as_string(self.msg.data, self.msg.data_len)
+        cached = self._data_cache
+        if cached is None or cached[0] is not msg:
+            # To be friendly, return data as a Python (byte) string
+            cached = self._data_cache = (msg, self.data_view.tobytes())
+        return cached[1]
+
+    @property
+    def data_view(self):
+        """
+        Returns a memoryview onto the payload of this KBUS message, or None
+        if it is not present.
+
+        This does not copy the data, so it is the thing to use when the data
+        is only going to be read. Remember that it shares the message's own
+        storage.
+
+            >>> msg = Message('$.Fred', data='1234')
+            >>> msg.data_view.tobytes()
+            '1234'
+            >>> Message.from_bytes(msg.to_bytes()).data_view.tobytes()
+            '1234'
+        """
+        msg = self.msg
+        data_len = msg.data_len
+        if data_len == 0:
+            return None
+        if msg.is_pointy:
+            # We need to retrieve our data from the pointer - ick
+            buf = ctypes.cast(msg.data,
+                              ctypes.POINTER(ctypes.c_uint8*data_len)).contents
+        else:
+            buf = msg.rest_data
+        return memoryview(buf)[:data_len]
 
     def extract(self):
         """Return our parts as a tuple.
@@ -1418,6 +1543,14 @@ class Message(object):
         return (self.id, self.in_reply_to, self.to, self.from_, self.orig_from,
                 self.final_to, self.flags, self.name, self.data)
 
+    def _extract_view(self):
+        """As :meth:`extract`, but with :attr:`data_view` rather than `data`.
+
+        For our __repr__ methods, which only need to read the data.
+        """
+        return (self.id, self.in_reply_to, self.to, self.from_, self.orig_from,
+                self.final_to, self.flags, self.name, self.data_view)
+
     def to_bytes(self):
         """Return the message as a string.
 
@@ -1673,10 +1806,8 @@ class Announcement(Message):
         raise TypeError("Announcements are not Requests")
 
     def __repr__(self):
-        (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self.extract()
-        args = [repr(name)]
-        if data is not None:
-            args.append('data=%s'%repr(hexdata(data)))
+        (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self._extract_view()
+        args = _repr_args(name, data)
         if to:
             args.append('to=%s'%repr(to))
         if from_:
@@ -1824,10 +1955,8 @@ class Request(Message):
         return message
 
     def __repr__(self):
-        (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self.extract()
-        args = [repr(name)]
-        if data is not None:
-            args.append('data=%s'%repr(hexdata(data)))
+        (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self._extract_view()
+        args = _repr_args(name, data)
         if to:
             args.append('to=%s'%repr(to))
         if from_:
@@ -1992,10 +2121,8 @@ class Reply(Message):
         return message
 
     def __repr__(self):
-        (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self.extract()
-        args = [repr(name)]
-        if data is not None:
-            args.append('data=%s'%repr(hexdata(data)))
+        (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self._extract_view()
+        args = _repr_args(name, data)
         if to:
             args.append('to=%s'%repr(to))
         if from_:
@@ -2093,10 +2220,8 @@ class Status(Message):
         return message
 
     def __repr__(self):
-        (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self.extract()
-        args = [repr(name)]
-        if data is not None:
-            args.append('data=%s'%repr(hexdata(data)))
+        (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self._extract_view()
+        args = _repr_args(name, data)
         if to:
             args.append('to=%s'%repr(to))
         if from_:
@@ -2240,19 +2365,22 @@ class _ReplierBindEventHeader(ctypes.Structure):
                 ('binder',  ctypes.c_uint32),
                 ('name_len',ctypes.c_uint32)]
 
+# The same layout as _ReplierBindEventHeader, for unpacking it in one go
+_ReplierBindEventHeaderStruct = struct.Struct('=III')
+
 def split_replier_bind_event_data(data):
     """Split the data from a ``$.KBUS.ReplierBindEvent`` message.
 
     Returns a tuple of the form (is_bind, binder, name)
     """
 
-    hdr = _struct_from_bytes(_ReplierBindEventHeader, data)
+    is_bind, binder, name_len = _ReplierBindEventHeaderStruct.unpack_from(data)
 
-    offset = ctypes.sizeof(_ReplierBindEventHeader)
+    offset = _ReplierBindEventHeaderStruct.size
 
-    name = data[offset:offset+hdr.name_len]
+    name = data[offset:offset+name_len]
 
-    return (hdr.is_bind, hdr.binder, name)
+    return (is_bind, binder, name)
 
 if __name__ == "__main__":
     import doctest
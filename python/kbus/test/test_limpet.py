@@ -38,12 +38,13 @@ import time
 import nose
 from multiprocessing import Process
 
-from kbus import Ksock, Message, MessageId, Announcement, \
+from kbus import Ksock, Message, MessageId, OrigFrom, Announcement, \
                  Request, Reply, Status, reply_to, stateful_request
 
 from kbus.test.test_kbus import check_IOError
 
-from kbus.limpet import run_a_limpet, GiveUp, OtherLimpetGoneAway
+from kbus.limpet import run_a_limpet, GiveUp, OtherLimpetGoneAway, \
+                        LimpetKsock
 
 NUM_DEVICES = 5
 TERMINATION_MESSAGE = '$.Terminate'
@@ -479,6 +480,59 @@ class TestLimpets(object):
 
 import traceback
 
+class CountingLimpetKsock(LimpetKsock):
+    """A LimpetKsock that remembers which Replier each Request was sent to.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.addressed_to = []
+        super(CountingLimpetKsock, self).__init__(*args, **kwargs)
+
+    def _address_request(self, hdr, msg, is_local, replier_id):
+        self.addressed_to.append(replier_id)
+        return super(CountingLimpetKsock, self)._address_request(hdr, msg,
+                                                                 is_local,
+                                                                 replier_id)
+
+class TestLimpetKsock(object):
+    """Tests of a LimpetKsock on its own, with no other Limpet.
+
+    These use a KBUS device that our pair of Limpets is not using.
+    """
+
+    def test_stale_replier_cache(self):
+        """A Request to a cached Replier that has gone away is sent once more.
+        """
+        with CountingLimpetKsock(3, 1, 2, '$.Nothing') as limpet:
+            with Ksock(3, 'rw') as replier:
+                replier.bind('$.Fred', True)
+                replier_id = replier.ksock_id()
+
+                gone = Ksock(3, 'rw')
+                gone_id = gone.ksock_id()
+                gone.close()
+
+                # Pretend we remembered the Replier before it went away
+                limpet._replier_cache['$.Fred'] = gone_id
+
+                # A Stateful Request, from beyond the other Limpet, which
+                # is not for a Replier on this KBUS in particular
+                request = Message('$.Fred', to=9, id=MessageId(2, 1),
+                                  final_to=OrigFrom(3, 7),
+                                  flags=Message.WANT_A_REPLY|
+                                        Message.WANT_YOU_TO_REPLY)
+                limpet.send_msg(request)
+
+                # Once with the remembered Replier, and once more with the
+                # one KBUS told us about
+                assert limpet.addressed_to == [gone_id, replier_id]
+                assert limpet._replier_cache['$.Fred'] == replier_id
+
+                that = replier.read_next_msg()
+                assert that.name == '$.Fred'
+                assert that.to == replier_id
+                assert replier.next_msg() == 0
+
 if __name__ == '__main__':
 
     if len(sys.argv) == 1:
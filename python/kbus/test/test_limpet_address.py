@@ -0,0 +1,101 @@
+#! /usr/bin/env python
+"""Tests for Limpet address parsing
+
+These don't need KBUS itself, so live apart from test_limpet.py (which
+loads the kernel module before any of its tests run).
+"""
+
+# ***** BEGIN LICENSE BLOCK *****
+# Version: MPL 1.1
+#
+# The contents of this file are subject to the Mozilla Public License Version
+# 1.1 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+# http://www.mozilla.org/MPL/
+#
+# Software distributed under the License is distributed on an "AS IS" basis,
+# WITHOUT WARRANTY OF ANY KIND, either express or implied. See the License
+# for the specific language governing rights and limitations under the
+# License.
+#
+# The Original Code is the KBUS Lightweight Linux-kernel mediated
+# message system
+#
+# The Initial Developer of the Original Code is Kynesim, Cambridge UK.
+# Portions created by the Initial Developer are Copyright (C) 2009
+# the Initial Developer. All Rights Reserved.
+#
+# Contributor(s):
+#   Kynesim, Cambridge UK
+#   Tibs <tony.ibbs@gmail.com>
+#
+# ***** END LICENSE BLOCK *****
+
+import socket
+import nose
+
+from kbus.limpet import parse_address, GiveUp
+
+class TestParseAddress(object):
+    """Each form of address that parse_address accepts, and what it rejects.
+    """
+
+    def test_host_and_port(self):
+        """<host>:<port> is a TCP/IP address.
+        """
+        assert parse_address('localhost:1234') == (('localhost', 1234),
+                                                   socket.AF_INET)
+
+    def test_empty_host(self):
+        """:<port> leaves the host empty, meaning "any interface".
+        """
+        assert parse_address(':1234') == (('', 1234), socket.AF_INET)
+
+    def test_path(self):
+        """Anything without a colon is taken to be a Unix domain socket path.
+        """
+        assert parse_address('/tmp/limpet') == ('/tmp/limpet', socket.AF_UNIX)
+        assert parse_address('fred') == ('fred', socket.AF_UNIX)
+
+    def test_explicit_unix(self):
+        """unix:<path> is a path, even if it contains colons.
+        """
+        assert parse_address('unix:/tmp/a:b') == ('/tmp/a:b', socket.AF_UNIX)
+        assert parse_address('unix:/tmp/a:80') == ('/tmp/a:80', socket.AF_UNIX)
+
+    def test_explicit_tcp(self):
+        """tcp://<host>:<port> is a TCP/IP address.
+        """
+        assert parse_address('tcp://example.com:80') == (('example.com', 80),
+                                                         socket.AF_INET)
+
+    def test_nothing_after_prefix(self):
+        """unix: and tcp:// must be followed by something.
+        """
+        nose.tools.assert_raises(ValueError, parse_address, 'unix:')
+        nose.tools.assert_raises(ValueError, parse_address, 'tcp://')
+
+    def test_bad_port(self):
+        """A port must be a (non-negative) integer.
+        """
+        nose.tools.assert_raises(GiveUp, parse_address, 'localhost:fred')
+        nose.tools.assert_raises(GiveUp, parse_address, 'localhost:')
+        nose.tools.assert_raises(GiveUp, parse_address, 'localhost:-1')
+
+    def test_colon_in_host(self):
+        """We don't support IPv6 style addresses.
+        """
+        nose.tools.assert_raises(GiveUp, parse_address, '::1:1234')
+        nose.tools.assert_raises(GiveUp, parse_address, 'a:b:1234')
+
+    def test_tcp_without_port(self):
+        """tcp:// must be followed by both host and port.
+        """
+        nose.tools.assert_raises(GiveUp, parse_address, 'tcp://localhost')
+
+    def test_tcp_bad_port(self):
+        """tcp://<host>:<port> still needs an integer port.
+        """
+        nose.tools.assert_raises(GiveUp, parse_address, 'tcp://localhost:fred')
+
+# vim: set tabstop=8 softtabstop=4 shiftwidth=4 expandtab:
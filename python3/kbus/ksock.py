@@ -39,9 +39,11 @@ it is likely enough not to do this, as the "user" will be root.
 import fcntl
 import ctypes
 import array
+import os
 import select
+import time
 
-from kbus.messages import MessageId, Message
+from kbus.messages import MessageId, Message, calc_entire_message_buffer_len
 
 # Kernel definitions for ioctl commands
 # Following closely from #include <asm[-generic]/ioctl.h>
@@ -73,6 +75,16 @@ def _IOR(t, nr, size):                          # read from device
 def _IOWR(t, nr, size):                         # read and write
     return _IOC(_IOC_READ | _IOC_WRITE, t, nr, size)
 
+# KBUS reads and writes all of the (non-structure) ioctl arguments as u32
+# values, and we use arrays of "I" to hold them - so make sure that fits
+if array.array('I').itemsize != 4:
+    raise ImportError("KBUS needs array typecode 'I' to be 32 bits, not %d"%(
+                      array.array('I').itemsize*8))
+
+# A MessageId is also a pair of u32 values, so we can make one straight
+# from the array that IOC_SEND or IOC_LASTSENT filled in
+_message_id_from_array = MessageId.from_buffer_copy
+
 
 class BindStruct(ctypes.Structure):
     """The datastucture we need to describe an :const:`IOC_BIND` argument
@@ -104,11 +116,15 @@ class Ksock(object):
     `mode` should be 'r' or 'rw' -- i.e., whether to open the device for read or
     write (opening for write also allows reading, of course).
 
-    Ksock can act like an iterable container; it implements
-    :meth:`__iter__` and :meth:`next` in the usual way. It also provides
+    Ksock can act like an iterable container; its :meth:`__iter__` is a
+    generator over the messages that can be read. It also provides
     :meth:`__enter__` and :meth:`__exit__` methods to support the use of 
     :keyword:`with`.
 
+    A Ksock reuses the same arrays for the arguments to most of its ioctls,
+    so it is not safe to call its methods from more than one thread at once
+    (which is also true of the underlying KBUS device).
+
     I'm not really very keen on the name Ksock, but it's better than the
     original "File", which I think was actively misleading.
     """
@@ -146,6 +162,18 @@ class Ksock(object):
         # Although Unix doesn't mind whether a file is opened with a 'b'
         # for binary, it is possible that some version of Python may
         self.fd = open(self.name, mode+'b', buffering=0)
+        # These are used on our hot paths, so only look them up once
+        self._read = self.fd.read
+        self._readinto = self.fd.readinto
+        self._fileno = self.fd.fileno()
+        # Scratch arrays and structures for our ioctl arguments and results,
+        # so we don't need to allocate new ones on every call
+        self._scratch1 = array.array('I', [0])
+        self._scratch2 = array.array('I', [0, 0])
+        self._bind_arg = BindStruct()
+        self._replier_arg = ReplierStruct()
+        # For wait_for_msg, created when it is first needed
+        self._epoll = None
 
     def __str__(self):
         if self.fd:
@@ -166,10 +194,14 @@ class Ksock(object):
         This implicitly unbinds the Ksock client object from every name it was
         bound to.  Any further attempt to use the object will cause errors.
         """
-        ret = self.fd.close()
-        self.fd = None
+        fd, epoll = self.fd, self._epoll
+        self.fd = self._epoll = None
+        self._fileno = -1       # as for any other closed file descriptor
         self.mode = None
-        return ret
+        if epoll is not None:
+            epoll.close()
+        if fd is not None:
+            fd.close()
 
     def bind(self, name, replier=False):
         """Bind the given name to the file descriptor.
@@ -178,8 +210,11 @@ class Ksock(object):
         message name.
         """
         name = bytes(name, encoding="utf-8")
-        arg = BindStruct(replier, len(name), name)
-        fcntl.ioctl(self.fd, Ksock.IOC_BIND, arg)
+        arg = self._bind_arg
+        arg.is_replier = replier
+        arg.len = len(name)
+        arg.name = name
+        fcntl.ioctl(self.fd, _IOC_BIND, arg)
 
     def unbind(self, name, replier=False):
         """Unbind the given name from the file descriptor.
@@ -187,18 +222,53 @@ class Ksock(object):
         The arguments need to match the binding that we want to unbind.
         """
         name = bytes(name, encoding="utf-8")
-        arg = BindStruct(replier, len(name), name)
-        fcntl.ioctl(self.fd, Ksock.IOC_UNBIND, arg)
+        arg = self._bind_arg
+        arg.is_replier = replier
+        arg.len = len(name)
+        arg.name = name
+        fcntl.ioctl(self.fd, _IOC_UNBIND, arg)
+
+    def bind_many(self, names, replier=False):
+        """Bind each of the given names to the file descriptor.
+
+        Entirely equivalent to calling :meth:`bind` for each name in turn,
+        but without the per-name overhead of doing so. If binding one of the
+        names fails, then the names before it will still have been bound.
+        """
+        self._bind_names(_IOC_BIND, names, replier)
+
+    def unbind_many(self, names, replier=False):
+        """Unbind each of the given names from the file descriptor.
+
+        Entirely equivalent to calling :meth:`unbind` for each name in turn,
+        but without the per-name overhead of doing so. If unbinding one of
+        the names fails, then the names before it will still have been unbound.
+        """
+        self._bind_names(_IOC_UNBIND, names, replier)
+
+    def _bind_names(self, command, names, replier):
+        ioctl = fcntl.ioctl
+        fd = self.fd
+        arg = self._bind_arg
+        arg.is_replier = replier
+        for name in names:
+            name = bytes(name, encoding="utf-8")
+            arg.len = len(name)
+            # Assigning the name to the structure also keeps it alive until
+            # we have finished with it
+            arg.name = name
+            ioctl(fd, command, arg)
 
     def ksock_id(self):
         """Return the internal 'Ksock id' for this file descriptor.
         """
         # Instead of using a ctypes.Structure, we can retrieve homogenious
         # arrays of data using, well, arrays. This one is a bit minimalist.
-        # (Our devout hope, here and elsewhere, is that "I" means a 32-bit
-        # unsigned value on 32-bit *and* 64-bit platforms.)
-        id = array.array('I', [0])
-        fcntl.ioctl(self.fd, Ksock.IOC_KSOCKID, id, True)
+        # (We check below that "I" means a 32-bit unsigned value, which is
+        # what KBUS uses, on 32-bit *and* 64-bit platforms.)
+        id = self._scratch1
+        id[0] = 0
+        fcntl.ioctl(self.fd, _IOC_KSOCKID, id, True)
         return id[0]
 
     def next_msg(self):
@@ -207,8 +277,9 @@ class Ksock(object):
         Returns the length of the next message, or 0 if there is no next
         message at the present time.
         """
-        id = array.array('I', [0])
-        fcntl.ioctl(self.fd, Ksock.IOC_NEXTMSG, id, True)
+        id = self._scratch1
+        id[0] = 0
+        fcntl.ioctl(self.fd, _IOC_NEXTMSG, id, True)
         return id[0]
 
     def len_left(self):
@@ -217,8 +288,9 @@ class Ksock(object):
         Returns 0 if there is no current message (i.e., :meth:`next_msg` has
         not been called), or if there are no bytes left.
         """
-        id = array.array('I', [0])
-        fcntl.ioctl(self.fd, Ksock.IOC_LENLEFT, id, True)
+        id = self._scratch1
+        id[0] = 0
+        fcntl.ioctl(self.fd, _IOC_LENLEFT, id, True)
         return id[0]
 
     def send(self):
@@ -231,9 +303,9 @@ class Ksock(object):
         Raises :class:`IOError` with errno :const:`ENOMSG` if no message
         has been written, i.e. there is nothing to send.
         """
-        arg = array.array('I', [0, 0])
-        fcntl.ioctl(self.fd, Ksock.IOC_SEND, arg);
-        return MessageId(arg[0], arg[1])
+        arg = self._scratch2
+        fcntl.ioctl(self.fd, _IOC_SEND, arg);
+        return _message_id_from_array(arg)
 
     def discard(self):
         """Discard the message being written.
@@ -243,24 +315,28 @@ class Ksock(object):
         written (for instance, because :meth:`send` has already been called).
         be sent.
         """
-        fcntl.ioctl(self.fd, Ksock.IOC_DISCARD, 0);
+        fcntl.ioctl(self.fd, _IOC_DISCARD, 0);
 
     def last_msg_id(self):
         """Return the id of the last message written on this file descriptor.
 
         Returns 0 before any messages have been sent.
         """
-        id = array.array('I', [0, 0])
-        fcntl.ioctl(self.fd, Ksock.IOC_LASTSENT, id, True)
-        return MessageId(id[0], id[1])
+        id = self._scratch2
+        fcntl.ioctl(self.fd, _IOC_LASTSENT, id, True)
+        return _message_id_from_array(id)
 
     def find_replier(self, name):
         """Find the id of the replier (if any) for this message.
 
         Returns None if there was no replier, otherwise the replier's id.
         """
-        arg = ReplierStruct(0, len(name), name)
-        retval = fcntl.ioctl(self.fd, Ksock.IOC_REPLIER, arg);
+        name = bytes(name, encoding="utf-8")
+        arg = self._replier_arg
+        arg.return_id = 0
+        arg.len = len(name)
+        arg.name = name
+        retval = fcntl.ioctl(self.fd, _IOC_REPLIER, arg);
         if retval:
             return arg.return_id
         else:
@@ -269,8 +345,9 @@ class Ksock(object):
     def max_messages(self):
         """Return the number of messages that can be queued on this Ksock.
         """
-        id = array.array('I', [0])
-        fcntl.ioctl(self.fd, Ksock.IOC_MAXMSGS, id, True)
+        id = self._scratch1
+        id[0] = 0
+        fcntl.ioctl(self.fd, _IOC_MAXMSGS, id, True)
         return id[0]
 
     def set_max_messages(self, count):
@@ -285,15 +362,17 @@ class Ksock(object):
         Returns the number of messages that are allowed to be queued on this
         Ksock.
         """
-        id = array.array('I', [count])
-        fcntl.ioctl(self.fd, Ksock.IOC_MAXMSGS, id, True)
+        id = self._scratch1
+        id[0] = count
+        fcntl.ioctl(self.fd, _IOC_MAXMSGS, id, True)
         return id[0]
 
     def num_messages(self):
         """Return the number of messages that are queued on this Ksock.
         """
-        id = array.array('I', [0])
-        fcntl.ioctl(self.fd, Ksock.IOC_NUMMSGS, id, True)
+        id = self._scratch1
+        id[0] = 0
+        fcntl.ioctl(self.fd, _IOC_NUMMSGS, id, True)
         return id[0]
 
     def num_unreplied_to(self):
@@ -303,8 +382,9 @@ class Ksock(object):
         :const:`Message.WANT_YOU_TO_REPLY` flag set, but for which we have 
         not yet sent a :class:`Reply`.
         """
-        id = array.array('I', [0])
-        fcntl.ioctl(self.fd, Ksock.IOC_UNREPLIEDTO, id, True)
+        id = self._scratch1
+        id[0] = 0
+        fcntl.ioctl(self.fd, _IOC_UNREPLIEDTO, id, True)
         return id[0]
 
     def want_messages_once(self, only_once=False, just_ask=False):
@@ -333,15 +413,7 @@ class Ksock(object):
         Ksock's message queue *as soon as it is set* - so changing it and then
         changing it back "at once" is not (necessarily) a null operation.
         """
-        if just_ask:
-            val = 0xFFFFFFFF
-        elif only_once:
-            val = 1
-        else:
-            val = 0
-        id = array.array('I', [val])
-        fcntl.ioctl(self.fd, Ksock.IOC_MSGONLYONCE, id, True)
-        return id[0]
+        return self._flag_ioctl(_IOC_MSGONLYONCE, only_once, just_ask)
 
     def kernel_module_verbose(self, verbose=True, just_ask=False):
         """Determine whether the kernel module should output verbose messages.
@@ -364,15 +436,7 @@ class Ksock(object):
         possible for several programs to open a Ksock and "disagree" about how
         this flag should be set.
         """
-        if just_ask:
-            val = 0xFFFFFFFF
-        elif verbose:
-            val = 1
-        else:
-            val = 0
-        id = array.array('I', [val])
-        fcntl.ioctl(self.fd, Ksock.IOC_VERBOSE, id, True)
-        return id[0]
+        return self._flag_ioctl(_IOC_VERBOSE, verbose, just_ask)
 
     def new_device(self):
         """Request that KBUS set up a new device (/dev/kbus<n>).
@@ -382,8 +446,9 @@ class Ksock(object):
 
         Returns the new device number (<n>).
         """
-        id = array.array('I', [0])
-        fcntl.ioctl(self.fd, Ksock.IOC_NEWDEVICE, id, True)
+        id = self._scratch1
+        id[0] = 0
+        fcntl.ioctl(self.fd, _IOC_NEWDEVICE, id, True)
         return id[0]
 
     def report_replier_binds(self, report_events=True, just_ask=False):
@@ -419,21 +484,27 @@ class Ksock(object):
         possible for several programs to open a Ksock and "disagree" about how
         this flag should be set.
         """
+        return self._flag_ioctl(_IOC_REPORTREPLIERBINDS, report_events, just_ask)
+
+    def _flag_ioctl(self, command, value, just_ask):
+        """Set (or, if `just_ask`, query) a KBUS flag, returning its old value.
+        """
+        id = self._scratch1
         if just_ask:
-            val = 0xFFFFFFFF
-        elif report_events:
-            val = 1
+            id[0] = 0xFFFFFFFF
+        elif value:
+            id[0] = 1
         else:
-            val = 0
-        id = array.array('I', [val])
-        fcntl.ioctl(self.fd, Ksock.IOC_REPORTREPLIERBINDS, id, True)
+            id[0] = 0
+        fcntl.ioctl(self.fd, command, id, True)
         return id[0]
 
     def max_message_size(self):
         """Return the maximum message size that can be written to this KBUS device.
         """
-        id = array.array('I', [0])
-        fcntl.ioctl(self.fd, Ksock.IOC_MAXMSGSIZE, id, True)
+        id = self._scratch1
+        id[0] = 0
+        fcntl.ioctl(self.fd, _IOC_MAXMSGSIZE, id, True)
         return id[0]
 
     def set_max_message_size(self, count):
@@ -451,18 +522,20 @@ class Ksock(object):
         Returns the maximum size of message that may be written to this KBUS
         device, or a query result as described above.
         """
-        id = array.array('I', [count])
-        fcntl.ioctl(self.fd, Ksock.IOC_MAXMSGSIZE, id, True)
+        id = self._scratch1
+        id[0] = count
+        fcntl.ioctl(self.fd, _IOC_MAXMSGSIZE, id, True)
         return id[0]
 
     def write_msg(self, message):
         """Write a Message. Doesn't send it.
         """
-        # Message data is held in an array.array, and arrays know
-        # how to write themselves out
+        # Message data is held in a ctypes structure, which supports the
+        # buffer interface, so we can write it out directly from where it is.
+        # Our file is unbuffered, so this goes straight to KBUS, and there
+        # is nothing to flush. We don't use os.write, as (on Python 2) that
+        # would raise OSError rather than the IOError our callers expect
         self.fd.write(message.msg)
-        # But we are responsible for flushing
-        self.fd.flush()
 
     def send_msg(self, message):
         """Write a Message, and then send it.
@@ -474,16 +547,36 @@ class Ksock(object):
         self.write_msg(message)
         return self.send()
 
+    def send_msgs(self, messages):
+        """Write and send each of a sequence of Messages.
+
+        KBUS only lets us write one message before we must send it, so this
+        is entirely equivalent to calling :meth:`send_msg` for each message
+        in turn, but without the per-message overhead of doing so.
+
+        Returns a list of the :class:`MessageId` of each message sent.
+        """
+        write_msg = self.write_msg
+        ioctl = fcntl.ioctl
+        fd = self.fd
+        arg = self._scratch2
+        message_id_from_array = _message_id_from_array
+        msg_ids = []
+        append = msg_ids.append
+        for message in messages:
+            write_msg(message)
+            ioctl(fd, _IOC_SEND, arg)
+            append(message_id_from_array(arg))
+        return msg_ids
+
     def write_data(self, data):
-        """Write out (and flush) some data.
+        """Write out some data.
 
         This does not actually send the message and does not imply that
         what has been written is all of a message
         (although clearly it should form *some* of a message).
         """
-        ret = self.fd.write(data)
-        self.fd.flush()
-        return ret
+        return self.fd.write(data)
 
     def read_msg(self, length):
         """Read a Message of length `length` bytes.
@@ -497,11 +590,7 @@ class Ksock(object):
 
         Returns None if there was nothing to be read.
         """
-        data = self.fd.read(length)
-        if data:
-            return Message.from_bytes(data)
-        else:
-            return None
+        return self._read_entire_msg(length)
 
     def read_next_msg(self):
         """Read the next Message.
@@ -512,30 +601,121 @@ class Ksock(object):
 
         Returns None if there was nothing to be read.
         """
-        data = self.fd.read(self.next_msg())
-        if data:
-            return Message.from_bytes(data)
+        # This is the same as next_msg(), but saves a method call
+        length = self._scratch1
+        length[0] = 0
+        fcntl.ioctl(self.fd, _IOC_NEXTMSG, length, True)
+        return self._read_entire_msg(length[0])
+
+    def _read_entire_msg(self, length):
+        """Read `length` bytes straight into a new Message.
+
+        The data is read into a buffer that the Message then uses directly,
+        so it is only copied once, by the kernel.
+
+        Returns None if there was nothing to be read.
+        """
+        buf = bytearray(calc_entire_message_buffer_len(length))
+        if self._readinto(memoryview(buf)[:length]):
+            return Message.from_buffer(buf)
         else:
             return None
 
+    def read_batch(self, max_n=64):
+        """Read up to `max_n` Messages, and return them as a list.
+
+        This is equivalent to calling :meth:`read_next_msg` up to `max_n`
+        times, stopping early if there is no next message, but without
+        the per-message overhead of doing so.
+
+        Returns an empty list if there was nothing to be read.
+        """
+        ioctl = fcntl.ioctl
+        fd = self.fd
+        length = self._scratch1
+        read_entire_msg = self._read_entire_msg
+        messages = []
+        append = messages.append
+        while len(messages) < max_n:
+            length[0] = 0
+            ioctl(fd, _IOC_NEXTMSG, length, True)
+            if not length[0]:
+                break
+            append(read_entire_msg(length[0]))
+        return messages
+
+    def batched_iter(self, max_n=64):
+        """Iterate over the Messages on this Ksock, `max_n` at a time.
+
+        Each iteration gives a list of (up to `max_n`) Messages, as returned
+        by :meth:`read_batch`. We stop when there is no next message to read.
+        So, for instance::
+
+            for batch in ksock.batched_iter():
+                for msg in batch:
+                    print(msg)
+        """
+        while True:
+            messages = self.read_batch(max_n)
+            if not messages:
+                return
+            yield messages
+
     def wait_for_msg(self, timeout=None):
         """Wait for the next Message.
 
-        This is a simple wrapper around :meth:`select.select`, waiting for the
-        next Message on this Ksock.
+        This is a simple wrapper around :meth:`select.epoll.poll`, waiting for
+        the next Message on this Ksock. The epoll object is created the first
+        time we wait, and kept until the Ksock is closed.
 
         If timeout is given, it is a floating point number of seconds,
-        after which to timeout the select, otherwise this method will
+        after which to timeout the wait, otherwise this method will
         wait forever.
 
         Returns the new Message, or None if the timeout expired.
         """
-        if timeout:
-            (r, w, x) = select.select([self], [], [], timeout)
+        if self._wait(timeout):
+            return self.read_next_msg()
         else:
-            (r, w, x) = select.select([self], [], [], timeout)
+            return None
+
+    def wait_for_batch(self, timeout=None, max_n=64):
+        """Wait for the next Message, and then read all that are available.
+
+        This waits in the same way as :meth:`wait_for_msg`, and then reads
+        up to `max_n` Messages with :meth:`read_batch`, so that a burst of
+        messages only needs one wait.
+
+        Returns a list of the Messages read, which will be empty if the
+        timeout expired.
+
+        If every Message we were woken for is one that :meth:`read_batch`
+        leaves out (as a :class:`~kbus.limpet.LimpetKsock` may), then we
+        go back to waiting for whatever is left of the timeout, rather than
+        returning an empty list early.
+        """
+        if timeout is not None:
+            deadline = time.time() + timeout
+        while self._wait(timeout):
+            messages = self.read_batch(max_n)
+            if messages:
+                return messages
+            if timeout is not None:
+                timeout = max(0, deadline - time.time())
+        return []
 
-        return self.read_next_msg()
+    def _wait(self, timeout):
+        """Wait for this Ksock to have a message, or `timeout` to expire.
+
+        Returns the list of events from :meth:`select.epoll.poll`.
+        """
+        epoll = self._epoll
+        if epoll is None:
+            epoll = self._epoll = select.epoll()
+            epoll.register(self._fileno, select.EPOLLIN)
+        if timeout is None:
+            timeout = -1
+        return epoll.poll(timeout)
 
     def read_data(self, count):
         """Read the next `count` bytes, and return them.
@@ -544,7 +724,7 @@ class Ksock(object):
         which is consistent with now Python file reads normally behave
         at end-of-file.
         """
-        return self.fd.read(count)
+        return self._read(count)
 
     # It's modern times, so we really should implement "with"
     # (it's so convenient)
@@ -553,34 +733,27 @@ class Ksock(object):
         return self
 
     def __exit__(self, etype, value, tb):
-        if tb is None:
-            # No exception, so just finish normally
-            self.close()
-        else:
-            # An exception occurred, so do any tidying up necessary
-            # - well, there isn't anything special to do, really
-            self.close()
-            # And allow the exception to be re-raised
-            return False
+        # Whether or not an exception occurred, there isn't anything
+        # special to do other than close ourselves
+        self.close()
+        # And allow any exception to be re-raised
+        return False
 
     # And what is a file-like object without iterator support?
     # Note that our iteration will stop when there is no next message
     # to read -- so trying to iterate again later on may work again...
 
     def __iter__(self):
-        return self
-
-    def __next__(self):
         """
         This provides iteration support.  Each iteration gives a whole message
         as returned by :meth:`read_next_msg`. We stop when there is
         no next message to read.
         """
-        msg = self.read_next_msg()
-        if msg == None:
-            raise StopIteration
-        else:
-            return msg
+        while True:
+            msg = self.read_next_msg()
+            if msg is None:
+                return
+            yield msg
 
     def fileno(self):
         """Return the integer file descriptor from our internal fd.
@@ -594,8 +767,37 @@ class Ksock(object):
         instead of the (less friendly, but also valid)::
 
             (r, w, x) = select.select([ksock1.fd, ksock2.fd, ksock3.fd], None, None)
-        """
-        return self.fd.fileno()
+
+        Raises ValueError if the Ksock has been closed.
+        """
+        if self._fileno < 0:
+            raise ValueError('I/O operation on closed Ksock')
+        return self._fileno
+
+# The ioctl commands are used on every call of the corresponding Ksock
+# methods, so look them up as module globals rather than as class attributes
+_IOC_RESET              = Ksock.IOC_RESET
+_IOC_BIND               = Ksock.IOC_BIND
+_IOC_UNBIND             = Ksock.IOC_UNBIND
+_IOC_KSOCKID            = Ksock.IOC_KSOCKID
+_IOC_REPLIER            = Ksock.IOC_REPLIER
+_IOC_NEXTMSG            = Ksock.IOC_NEXTMSG
+_IOC_LENLEFT            = Ksock.IOC_LENLEFT
+_IOC_SEND               = Ksock.IOC_SEND
+_IOC_DISCARD            = Ksock.IOC_DISCARD
+_IOC_LASTSENT           = Ksock.IOC_LASTSENT
+_IOC_MAXMSGS            = Ksock.IOC_MAXMSGS
+_IOC_NUMMSGS            = Ksock.IOC_NUMMSGS
+_IOC_UNREPLIEDTO        = Ksock.IOC_UNREPLIEDTO
+_IOC_MSGONLYONCE        = Ksock.IOC_MSGONLYONCE
+_IOC_VERBOSE            = Ksock.IOC_VERBOSE
+_IOC_NEWDEVICE          = Ksock.IOC_NEWDEVICE
+_IOC_REPORTREPLIERBINDS = Ksock.IOC_REPORTREPLIERBINDS
+_IOC_MAXMSGSIZE         = Ksock.IOC_MAXMSGSIZE
+
+# How /proc/kbus/bindings says whether a binding is for a Replier ('R')
+# or (just a) Listener ('L')
+_BINDING_IS_REPLIER = {'R':True, 'L':False}
 
 def read_bindings(names):
     """Read the bindings from ``/proc/kbus/bindings``, and return a list
@@ -622,27 +824,35 @@ def read_bindings(names):
         [ ('f1', True, '$.Fred'), ('f2', False, '$.Fred.Bob'),
           (12, True, '$.William' ]
     """
-    f = open('/proc/kbus/bindings')
-    l = f.readlines()
-    f.close()
+    # This is a small file that we read all at once, so we don't need (or want)
+    # the extra layers of a buffered text file to read it
+    fd = os.open('/proc/kbus/bindings', os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    data = b''.join(chunks).decode("utf-8")
     bindings = []
-    for line in l:
-        if line[0] == '#':
+    append = bindings.append
+    get_name = names.get
+    is_replier = _BINDING_IS_REPLIER
+    for line in data.splitlines():
+        if not line or line[0] == '#':
             continue
         # 'dev' is the device index (default is 0, may be 0..9 depending on how
         # many /dev/kbus<N> devices there are).
         # For the moment, we're going to ignore it.
         dev, id, pid, rep, name = line.split()
         id = int(id)
-        if id in names:
-            id = names[int(id)]
-        if rep == 'R':          # Replier
-            rep = True
-        elif rep == 'L':        # (just a) Listener
-            rep = False
-        else:
+        try:
+            append((get_name(id, id), is_replier[rep], name))
+        except KeyError:
             raise ValueError("Got replier '%c' when expecting 'R' or 'L'"%rep)
-        bindings.append((id, rep, name))
     return bindings
 
 # vim: set tabstop=8 softtabstop=4 shiftwidth=4 expandtab:
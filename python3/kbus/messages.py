@@ -240,11 +240,17 @@ def c_data_as_bytes(data, data_len):
     """
     return bytes(data[:data_len])
 
+# How hexdata() represents each possible byte value
+_HEXDATA_PRETTY = string.ascii_letters + string.digits + string.punctuation
+_HEXDATA_TABLE = tuple([chr(ch) if chr(ch) in _HEXDATA_PRETTY else '\\x%02x'%ch
+                        for ch in range(256)])
+
 def hexdata(data, encoding="utf-8", errors="strict"):
     r"""Return a representation of a 'string' in printable form.
 
     If the string is a Python string rather than a bytes object, it will be
     encoded using `encoding` and `errors` exactly as :meth:`str.encode()`.
+    A memoryview (such as :attr:`Message.data_view`) is also acceptable.
 
     Doesn't use whitespace or anything not in letters, digits or punctuation.
     Thus, the resultant string should be entirely equivalent in "meaning" to
@@ -263,16 +269,10 @@ def hexdata(data, encoding="utf-8", errors="strict"):
         >>> hexdata('\x03')
         '\\x03'
     """
-    pretty = string.ascii_letters + string.digits + string.punctuation
-    words = []
     if isinstance(data, str):
         data = data.encode(encoding=encoding, errors=errors)
-    for ch in data:
-        if chr(ch) in pretty:
-            words.append(chr(ch))
-        else:
-            words.append('\\x%02x'%ch)
-    return ''.join(words)
+    table = _HEXDATA_TABLE
+    return ''.join([table[ch] for ch in data])
 
 def hexify(data, encoding="utf-8", errors="strict"):
     r"""Return a representation of a 'string' as hex values.
@@ -296,6 +296,19 @@ def hexify(data, encoding="utf-8", errors="strict"):
         words.append('%02x'%ch)
     return ' '.join(words)
 
+def _data_repr(data):
+    """Return a representation of (actual) message data, for use in a __repr__.
+    """
+    return repr(hexdata(data))
+
+def _repr_args(name, data):
+    """Return the name and (any) data arguments for a message __repr__.
+    """
+    if data is None:
+        return [repr(name)]
+    else:
+        return [repr(name), 'data=%s'%repr(data)]
+
 def _int_tuple_as_str(data):
     """Return a representation of a tuple of integers, as a string.
     """
@@ -336,17 +349,17 @@ class _MessageHeaderStruct(ctypes.Structure):
     def __repr__(self):
         """For debugging, not construction of an instance of ourselves.
         """
-        if self.name == None:
+        if self.name is None:
             nn = 'None'
         else:
             nn = repr(hexdata(self.name))
-        if self.data == None:
+        # A NULL pointer is false, but is never equal to None
+        if not self.data:
             dd = 'None'
         else:
             # We need to retrieve our data from the pointer - ick
             p = ctypes.cast(self.data, ctypes.POINTER(ctypes.c_uint8*self.data_len))
-            s = ctypes.string_at(p, self.data_len)
-            dd = repr(hexdata(s))
+            dd = _data_repr(memoryview(p.contents).cast('B'))
         return "<%08x] %s %s %u %u %s %s %08x %u %u %s %s [%08x>"%(
                 self.start_guard,
                 self.id._short_str(),
@@ -403,6 +416,12 @@ def _struct_from_bytes(struct_class, data, encoding="utf-8", errors="strict"):
 
 MSG_HEADER_LEN = ctypes.sizeof(_MessageHeaderStruct)
 
+# For reading just the start guard, and the name and data lengths, from the
+# bytes of a message header, without building a whole header structure
+_StartGuardStruct = struct.Struct('=L')
+_NameAndDataLenStruct = struct.Struct('=LL')
+_NAME_LEN_OFFSET = _MessageHeaderStruct.name_len.offset
+
 def calc_padded_name_len(name_len):
     """Calculate the length of a message name, in bytes, after padding.
 
@@ -427,6 +446,17 @@ def calc_entire_message_len(name_len, data_len):
     return MSG_HEADER_LEN + calc_padded_name_len(name_len) + \
                             calc_padded_data_len(data_len) + 4
 
+def calc_entire_message_buffer_len(length):
+    """Calculate how big a buffer is needed to hold an "entire" message.
+
+    'length' is the "entire" message length (as, for instance, returned by
+    :meth:`Ksock.next_msg`). The result allows for any padding that the C
+    datastructure has after the final end guard (so, for instance, 4 more
+    bytes on a 64-bit machine).
+    """
+    align = ctypes.alignment(_MessageHeaderStruct)
+    return align * ((length + align - 1) // align)
+
 def message_from_parts(id, in_reply_to, to, from_, orig_from, final_to, flags, name, data, encoding="utf-8", errors="strict"):
     """Return a new Message header structure, with name and data attached.
 
@@ -537,7 +567,7 @@ class _EntireMessageStructBaseclass(ctypes.Structure):
         else:
             name_repr = 'None'
         if self.data_len:
-            data_repr = repr(hexdata(ctypes.string_at(self.rest_data, self.data_len)))
+            data_repr = _data_repr(memoryview(self.rest_data).cast('B')[:self.data_len])
         else:
             data_repr = None
         return "%s %s %s [%08x>"%(
@@ -755,7 +785,7 @@ def _entire_message_from_bytes(data):
     if len(data) < MSG_HEADER_LEN:
         raise ValueError('Cannot form entire message from string'
                          ' "%s" of length %d'%(hexdata(data),len(data)))
-    if struct.unpack('=L',data[:4])[0] != Message.START_GUARD:
+    if _StartGuardStruct.unpack_from(data)[0] != Message.START_GUARD:
         raise ValueError('Cannot form entire message from string "%s..%s"'
                          ' which does not start with message start'
                          ' guard'%(hexdata(data[:8]),hexdata(data[-8:])))
@@ -765,24 +795,26 @@ def _entire_message_from_bytes(data):
         print()
         print('_entire_message_from_bytes(%d:%s)'%(len(data),hexify(data)))
     ## ===================================
-    h = _struct_from_bytes(_MessageHeaderStruct, data)
+    name_len, data_len = _NameAndDataLenStruct.unpack_from(data,
+                                                           _NAME_LEN_OFFSET)
     ## ===================================
     if debug:
+        h = _struct_from_bytes(_MessageHeaderStruct, data)
         print('_MessageHeaderStruct: %s'%h)
     ## ===================================
 
     # Don't forget that the string will be terminated with a 0 byte
-    padded_name_len = calc_padded_name_len(h.name_len)
+    padded_name_len = calc_padded_name_len(name_len)
 
     # But not so the data
-    padded_data_len = calc_padded_data_len(h.data_len)
+    padded_data_len = calc_padded_data_len(data_len)
 
     local_class = _specific_entire_message_struct(padded_name_len,
                                                   padded_data_len)
 
     ## ===================================
     if debug:
-        print('name_len %d -> %d, data_len %d -> %d'%(h.name_len, padded_name_len, h.data_len, padded_data_len))
+        print('name_len %d -> %d, data_len %d -> %d'%(name_len, padded_name_len, data_len, padded_data_len))
         x = _struct_from_bytes(local_class, data)
         print('_specific_class:      %s'%x)
         print()
@@ -790,6 +822,30 @@ def _entire_message_from_bytes(data):
 
     return _struct_from_bytes(local_class, data)
 
+def _entire_message_from_buffer(buf):
+    """Return a message structure that uses the memory in 'buf' directly.
+
+    'buf' is a writable buffer (for instance, a bytearray) containing an entire
+    message. The message is not copied, so 'buf' must not be reused for
+    anything else afterwards.
+
+    'buf' must be at least as long as the message structure, which may be
+    slightly longer than the message itself - see
+    :func:`calc_entire_message_buffer_len`.
+    """
+    if len(buf) < MSG_HEADER_LEN:
+        raise ValueError('Cannot form entire message from buffer'
+                         ' "%s" of length %d'%(hexdata(buf),len(buf)))
+    h = _MessageHeaderStruct.from_buffer(buf)
+    if h.start_guard != Message.START_GUARD:
+        raise ValueError('Cannot form entire message from buffer "%s..%s"'
+                         ' which does not start with message start'
+                         ' guard'%(hexdata(buf[:8]),hexdata(buf[-8:])))
+    local_class = _specific_entire_message_struct(
+                                    calc_padded_name_len(h.name_len),
+                                    calc_padded_data_len(h.data_len))
+    return local_class.from_buffer(buf)
+
 class Message:
     r"""A wrapper for a KBUS message
 
@@ -985,6 +1041,9 @@ class Message:
     ALL_OR_WAIT         = _BIT(8)
     ALL_OR_FAIL         = _BIT(9)
 
+    # (msg, data) for the last time the `data` property was asked for
+    _data_cache = None
+
     def __init__(self, name, data=None, to=None, from_=None, orig_from=None,
                  final_to=None, in_reply_to=None, flags=None, id=None,
                  encoding="utf-8", errors="strict"):
@@ -1068,6 +1127,29 @@ class Message:
         message.msg = _entire_message_from_bytes(arg)
         return message
 
+    @staticmethod
+    def from_buffer(buf):
+        """Construct a :class:`Message` that uses the memory in `buf` directly.
+
+        This is like :meth:`from_bytes`, except that the message data is not
+        copied - `buf` must be a writable buffer (such as a bytearray), and
+        must not be reused for anything else afterwards. It must also be long
+        enough - see :func:`calc_entire_message_buffer_len`.
+
+        For instance:
+
+            >>> msg1 = Message('$.Fred', '12345678')
+            >>> data = msg1.to_bytes()
+            >>> buf = bytearray(calc_entire_message_buffer_len(len(data)))
+            >>> buf[:len(data)] = data
+            >>> msg2 = Message.from_buffer(buf)
+            >>> msg2
+            Message('$.Fred', data=b'12345678')
+        """
+        message = Message.__new__(Message,'')
+        message.msg = _entire_message_from_buffer(buf)
+        return message
+
     def _merge_args(self, extracted, this_data, this_to, this_from_,
                     this_orig_from, this_final_to, this_in_reply_to,
                     this_flags, this_id, encoding, errors):
@@ -1151,9 +1233,7 @@ class Message:
 
     def __repr__(self):
         (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self.extract()
-        args = [repr(name)]
-        if data is not None:
-            args.append('data=%s'%repr(data))
+        args = _repr_args(name, data)
         if to:
             args.append('to=%s'%repr(to))
         if from_:
@@ -1427,11 +1507,46 @@ class Message:
         """
         Returns the payload of this KBUS message as a Python bytes object,
         or None if it is not present.
+
+        The bytes object is only built the first time it is asked for - after
+        that, the same object is returned until `msg` is replaced. Use
+        :attr:`data_view` to look at the data without copying it at all.
+        """
+        msg = self.msg
+        if msg.data_len == 0:
+            return None
+        cached = self._data_cache
+        if cached is None or cached[0] is not msg:
+            cached = self._data_cache = (msg, self.data_view.tobytes())
+        return cached[1]
+
+    @property
+    def data_view(self):
+        """
+        Returns a memoryview onto the payload of this KBUS message, or None
+        if it is not present.
+
+        This does not copy the data, so it is the thing to use when the data
+        is only going to be read. Remember that it shares the message's own
+        storage.
+
+            >>> msg = Message('$.Fred', data=b'1234')
+            >>> msg.data_view.tobytes()
+            b'1234'
+            >>> Message.from_bytes(msg.to_bytes()).data_view.tobytes()
+            b'1234'
         """
-        if self.msg.data_len == 0:
+        msg = self.msg
+        data_len = msg.data_len
+        if data_len == 0:
             return None
-        # To be friendly, return data as a Python (byte) string
-        return c_data_as_bytes(self.msg.data, self.msg.data_len)
+        if msg.is_pointy:
+            # We need to retrieve our data from the pointer - ick
+            buf = ctypes.cast(msg.data,
+                              ctypes.POINTER(ctypes.c_uint8*data_len)).contents
+        else:
+            buf = msg.rest_data
+        return memoryview(buf).cast('B')[:data_len]
 
     def extract(self):
         """Return our parts as a tuple.
@@ -1707,9 +1822,7 @@ class Announcement(Message):
 
     def __repr__(self):
         (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self.extract()
-        args = [repr(name)]
-        if data is not None:
-            args.append('data=%s'%repr(data))
+        args = _repr_args(name, data)
         if to:
             args.append('to=%s'%repr(to))
         if from_:
@@ -1859,9 +1972,7 @@ class Request(Message):
 
     def __repr__(self):
         (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self.extract()
-        args = [repr(name)]
-        if data is not None:
-            args.append('data=%s'%repr(data))
+        args = _repr_args(name, data)
         if to:
             args.append('to=%s'%repr(to))
         if from_:
@@ -2029,9 +2140,7 @@ class Reply(Message):
 
     def __repr__(self):
         (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self.extract()
-        args = [repr(name)]
-        if data is not None:
-            args.append('data=%s'%repr(data))
+        args = _repr_args(name, data)
         if to:
             args.append('to=%s'%repr(to))
         if from_:
@@ -2132,9 +2241,7 @@ class Status(Message):
 
     def __repr__(self):
         (id, in_reply_to, to, from_, orig_from, final_to, flags, name, data) = self.extract()
-        args = [repr(name)]
-        if data is not None:
-            args.append('data=%s'%repr(data))
+        args = _repr_args(name, data)
         if to:
             args.append('to=%s'%repr(to))
         if from_:
@@ -2279,19 +2386,22 @@ class _ReplierBindEventHeader(ctypes.Structure):
                 ('binder',  ctypes.c_uint32),
                 ('name_len',ctypes.c_uint32)]
 
+# The same layout as _ReplierBindEventHeader, for unpacking it in one go
+_ReplierBindEventHeaderStruct = struct.Struct('=III')
+
 def split_replier_bind_event_data(data):
     """Split the data from a ``$.KBUS.ReplierBindEvent`` message.
 
     Returns a tuple of the form (is_bind, binder, name)
     """
 
-    hdr = _struct_from_bytes(_ReplierBindEventHeader, data)
+    is_bind, binder, name_len = _ReplierBindEventHeaderStruct.unpack_from(data)
 
-    offset = ctypes.sizeof(_ReplierBindEventHeader)
+    offset = _ReplierBindEventHeaderStruct.size
 
-    name = data[offset:offset+hdr.name_len].decode()
+    name = data[offset:offset+name_len].decode()
 
-    return (hdr.is_bind, hdr.binder, name)
+    return (is_bind, binder, name)
 
 if __name__ == "__main__":
     import doctest
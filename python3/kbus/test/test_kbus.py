@@ -205,6 +205,20 @@ class RecordingKsock(Ksock):
         super(RecordingKsock, self).unbind(name, replier)
         self.bindings.forget_binding(self, name, replier)
 
+    def bind_many(self, names, replier=False):
+        """A wrapper around the 'bind_many' function, to keep track of bindings.
+        """
+        super(RecordingKsock, self).bind_many(names, replier)
+        for name in names:
+            self.bindings.remember_binding(self, name, replier)
+
+    def unbind_many(self, names, replier=False):
+        """A wrapper around the 'unbind_many' function, to keep track of bindings.
+        """
+        super(RecordingKsock, self).unbind_many(names, replier)
+        for name in names:
+            self.bindings.forget_binding(self, name, replier)
+
 def str_rep(rep):
     if rep:
         return 'R'
@@ -328,6 +342,27 @@ class TestKsock:
         nose.tools.assert_raises(ValueError, Ksock, 0, 'w+')
         nose.tools.assert_raises(ValueError, Ksock, 0, 'x')
 
+    def test_fileno(self):
+        """Test a closed Ksock has no file descriptor to give us
+        """
+        f = Ksock(0, 'r')
+        assert f.fileno() == f.fd.fileno()
+        f.close()
+        nose.tools.assert_raises(ValueError, f.fileno)
+
+    def test_write_msg_errors(self):
+        """Test KBUS rejecting a message in write_msg gives us an IOError
+        """
+        f = Ksock(0, 'rw')
+        try:
+            # KBUS checks the message name when it is written
+            m = Message('$.' + 'x'*1000)
+            check_IOError(errno.ENAMETOOLONG, f.write_msg, m)
+            # and that didn't leave anything half written
+            f.send_msg(Message('$.Fred'))
+        finally:
+            f.close()
+
 class TestKernelModule:
 
     def __init__(self):
@@ -543,6 +578,22 @@ class TestKernelModule:
         finally:
             assert f.close() is None
 
+    def test_bind_many(self):
+        """Initial ioctl/bind test -- make lots of bindings in one go
+        """
+        f = RecordingKsock(0, 'rw', self.bindings)
+        assert f != None
+
+        try:
+            f.bind_many(['$.Fred', '$.Fred.Jim', '$.Fred.Bob'])
+            f.bind_many(['$.Jim', '$.Bob'], True)
+            f.unbind_many(['$.Fred', '$.Fred.Bob'])
+            f.unbind_many(['$.Bob'], True)
+            # We can't unbind something we've not bound
+            check_IOError(errno.EINVAL, f.unbind_many, ['$.JimBob'])
+        finally:
+            assert f.close() is None
+
     def test_bind_more(self):
         """Initial ioctl/bind test - with more bindings.
         """
@@ -1031,6 +1082,60 @@ class TestKernelModule:
                 count += 1
             assert count == 5
 
+    def test_batched_iteration(self):
+        """Test we can read and iterate over messages in batches.
+        """
+        with RecordingKsock(0, 'rw', self.bindings) as f:
+            assert f != None
+            f.bind('$.Fred')
+            m = Message('$.Fred')
+            for ii in range(5):
+                f.send_msg(m)
+            batch = f.read_batch(3)
+            assert len(batch) == 3
+            for r in batch:
+                assert r.equivalent(m)
+            batch = f.read_batch(3)
+            assert len(batch) == 2
+            assert f.read_batch(3) == []
+            # And via iteration
+            for ii in range(5):
+                f.send_msg(m)
+            sizes = [len(batch) for batch in f.batched_iter(2)]
+            assert sizes == [2, 2, 1]
+
+    def test_send_msgs(self):
+        """Test we can send a sequence of messages in one go.
+        """
+        with RecordingKsock(0, 'rw', self.bindings) as f:
+            assert f != None
+            f.bind('$.Fred')
+            m = Message('$.Fred')
+            msg_ids = f.send_msgs([m, m, m])
+            assert len(msg_ids) == 3
+            assert msg_ids[-1] == f.last_msg_id()
+            for msg_id in msg_ids:
+                r = f.read_next_msg()
+                assert r.equivalent(m)
+                assert r.id == msg_id
+            assert f.read_next_msg() is None
+            assert f.send_msgs([]) == []
+
+    def test_wait_for_batch(self):
+        """Test we can wait for a burst of messages, and read them in one go.
+        """
+        with RecordingKsock(0, 'rw', self.bindings) as f:
+            assert f != None
+            f.bind('$.Fred')
+            m = Message('$.Fred')
+            f.send_msgs([m, m, m])
+            batch = f.wait_for_batch(0.1)
+            assert len(batch) == 3
+            for r in batch:
+                assert r.equivalent(m)
+            # And if there's nothing there, we time out
+            assert f.wait_for_batch(0.1) == []
+
     def test_wildcard_listening_1(self):
         """Test using wildcards to listen - 1, asterisk.
         """
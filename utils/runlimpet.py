@@ -17,6 +17,9 @@ command line is not significant, but if a later <thing> contradicts an earlier
     <host>:<port>   Communicate via the specified host and port
                     (the <host> is ignored on the 'server').
     <path>          Communicate via the named Unix domain socket.
+    tcp://<host>:<port>, unix:<path>
+                    The same, but saying explicitly which is meant (so
+                    that <path> may contain a colon).
 
         One or the other communication mechanism must be specified.
 
@@ -41,6 +44,11 @@ command line is not significant, but if a later <thing> contradicts an earlier
 
     -v <n>          Verbosity level. Default is 1. 0 means less, 2 means more.
 
+    -coalesce <us>  When KBUS has no more messages for us, wait up to <us>
+                    microseconds in case more arrive, so that they can be
+                    sent to the other Limpet together. The default is 0,
+                    which means never wait.
+
 This is an example application, not intended to production use.
 """
 
@@ -286,29 +294,10 @@ effect...
 """
 
 import os
-import socket
 import sys
 
-from kbus.limpet import run_a_limpet, GiveUp, OtherLimpetGoneAway
-
-def parse_address(word):
-    """Work out what sort of address we have.
-
-    Returns (address, family)
-    """
-    if ':' in word:
-        try:
-            host, port = word.split(':')
-            port = int(port)
-            address = host, port
-            family = socket.AF_INET
-        except Exception as exc:
-            raise GiveUp('Unable to interpret "%s" as <host>:<port>: %s'%(word, exc))
-    else:
-        # Assume it's a valid pathname (!)
-        address = word
-        family = socket.AF_UNIX
-    return address, family
+from kbus.limpet import run_a_limpet, parse_address, GiveUp, \
+                        OtherLimpetGoneAway
 
 def main(args):
     """Work out what we've been asked to do and do it.
@@ -319,6 +308,7 @@ def main(args):
     network_id = None
     message_name = '$.*'
     verbosity = 1
+    coalesce_max_us = 0
 
     if not args:
         print __doc__
@@ -360,12 +350,25 @@ def main(args):
                 except:
                     raise GiveUp('-v requires an argument (verbosity number)')
                 args = args[1:]
+            elif word == '-coalesce':
+                try:
+                    coalesce_max_us = int(args[0])
+                except:
+                    raise GiveUp('-coalesce requires an integer argument'
+                                 ' (microseconds)')
+                if coalesce_max_us < 0:
+                    raise GiveUp('Illegal coalescing time (-coalesce %d), it'
+                                 ' must be >= 0'%coalesce_max_us)
+                args = args[1:]
             else:
                 print __doc__
                 return
         else:
             # Deliberately allow multiple "address" values, using the last
-            address, family = parse_address(word)
+            try:
+                address, family = parse_address(word)
+            except ValueError as exc:
+                raise GiveUp(str(exc))
 
     if is_server is None:
         raise GiveUp('Either -client or -server must be specified')
@@ -378,7 +381,8 @@ def main(args):
 
     # And then do whatever we've been asked to do...
     run_a_limpet(is_server, address, family, kbus_device, network_id,
-                 message_name, verbosity=verbosity)
+                 message_name, verbosity=verbosity,
+                 coalesce_max_us=coalesce_max_us)
 
 if __name__ == "__main__":
     args = sys.argv[1:]